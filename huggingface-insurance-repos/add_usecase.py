@@ -435,24 +435,22 @@ def link_to_hub(usecase_name, hub_path="../gcc-insurance-ai-hub"):
     except Exception as e:
         print(f"! Could not link to hub: {e}")
 
-def main():
-    parser = argparse.ArgumentParser(description='Add new use case to GCC Insurance Intelligence Lab')
-    parser.add_argument('name', help='Name of the new use case (e.g., premium-lapse-monitor)')
-    parser.add_argument('--datasets', nargs='*', help='Optional synthetic datasets to create')
-    
-    args = parser.parse_args()
-    
-    usecase_name = args.name.lower().replace(' ', '-')
+def create_usecase(name, datasets=None):
+    """
+    Create the use case repository for name (with optional synthetic datasets)
+    and link it to the hub. Returns False if the name is invalid or taken.
+    """
+    usecase_name = name.lower().replace(' ', '-')
     
     # Validate name format
     if not usecase_name.replace('-', '').replace('_', '').isalnum():
         print("❌ Error: Use case name can only contain letters, numbers, hyphens, and underscores")
-        sys.exit(1)
+        return False
     
     # Create directory
     if os.path.exists(usecase_name):
         print(f"❌ Error: Directory {usecase_name} already exists")
-        sys.exit(1)
+        return False
     
     os.makedirs(usecase_name)
     print(f"✓ Created directory: {usecase_name}")
@@ -477,8 +475,8 @@ def main():
         print(f"✓ Created: {filename}")
     
     # Create synthetic dataset if requested
-    if args.datasets:
-        for dataset_name in args.datasets:
+    if datasets:
+        for dataset_name in datasets:
             dataset_content = create_synthetic_dataset(dataset_name)
             dataset_path = os.path.join(usecase_name, f"{dataset_name}.csv")
             with open(dataset_path, 'w') as f:
@@ -506,6 +504,17 @@ def main():
     print("- CI/CD automation")
     print("- Hub linking")
     print("\n🚀 To deploy: cd {usecase_name} && python3 app.py")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description='Add new use case to GCC Insurance Intelligence Lab')
+    parser.add_argument('name', help='Name of the new use case (e.g., premium-lapse-monitor)')
+    parser.add_argument('--datasets', nargs='*', help='Optional synthetic datasets to create')
+    
+    args = parser.parse_args()
+    
+    if not create_usecase(args.name, datasets=args.datasets):
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
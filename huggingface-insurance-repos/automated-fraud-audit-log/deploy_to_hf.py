@@ -4,10 +4,11 @@ This script deploys the automated-fraud-audit-log to Hugging Face Spaces
 """
 
 import os
-from huggingface_hub import HfApi, create_repo
 
 def deploy_to_hf():
     """Deploy to Hugging Face"""
+    from huggingface_hub import HfApi, create_repo
+    
     api = HfApi()
     
     # Repository details
@@ -0,0 +1,76 @@
+"""
+Factory Deploy - In-process Hugging Face deployment for factory agents
+
+Same steps as the deploy_to_hf.py script generated into every agent, callable
+from the factory without starting a new interpreter per agent.
+"""
+
+import os
+
+# Files uploaded for every agent Space
+SPACE_FILES = (
+    "app.py",
+    "requirements.txt",
+    "README.md",
+    "model_card.md",
+)
+
+_api = None
+
+
+def shared_api():
+    """
+    Process-wide HfApi, created on first use so huggingface_hub is only
+    imported when something is deployed; reusing it keeps the HTTP session
+    (and its kept-alive connections) across agents
+    """
+    global _api
+    if _api is None:
+        from huggingface_hub import HfApi
+        _api = HfApi()
+    return _api
+
+
+def deploy(repo_path, repo_id, api=None):
+    """Create/update the Space repo_id and upload the agent files from repo_path"""
+    if api is None:
+        api = shared_api()
+
+    repo_type = "space"
+
+    print(f"Creating/updating repository: {repo_id}")
+
+    # Create the repository
+    api.create_repo(
+        repo_id=repo_id,
+        repo_type=repo_type,
+        space_sdk="gradio",
+        exist_ok=True,
+        private=False
+    )
+
+    # Upload all present files in a single commit
+    present = []
+    for filename in SPACE_FILES:
+        if os.path.exists(os.path.join(repo_path, filename)):
+            present.append(filename)
+        else:
+            print(f"⚠️ {filename} not found")
+
+    if not present:
+        print("❌ No files to upload, nothing pushed")
+        return
+
+    print(f"Uploading {', '.join(present)}...")
+    api.upload_folder(
+        folder_path=str(repo_path),
+        repo_id=repo_id,
+        repo_type=repo_type,
+        allow_patterns=present,
+        commit_message=f"Publish {repo_id.split('/')[-1]}"
+    )
+    for filename in present:
+        print(f"✓ {filename} uploaded")
+
+    print(f"\n✅ Repository {repo_id} has been updated on Hugging Face Hub!")
+    print(f"URL: https://huggingface.co/spaces/{repo_id}")
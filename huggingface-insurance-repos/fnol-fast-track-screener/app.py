@@ -1,5 +1,50 @@
 import gradio as gr
 import random
+import sys
+from pathlib import Path
+
+# Shared FNOL routing kernel (bundled next to app.py when deployed)
+sys.path.append(str(Path(__file__).parent.parent))
+from fnol_common import ROUTES, route_claim
+
+# Incident categories that need an investigation report
+_INVEST_CATS = frozenset({'Fire', 'Theft'})
+
+# Required documents checklists, keyed by
+# (loss_severity >= 3, incident_category needs an investigation report)
+_DOC_BASE = (
+    "✓ Police report (if applicable)\n"
+    "✓ Photos of damage/incident\n"
+    "✓ Witness statements\n"
+    "✓ Medical records (if injury involved)"
+)
+_DOC_EXPERT = "\n✓ Expert assessment required"
+_DOC_INVEST = "\n✓ Fire marshal/police investigation report"
+_DOCS = {
+    (False, False): _DOC_BASE,
+    (True, False): _DOC_BASE + _DOC_EXPERT,
+    (False, True): _DOC_BASE + _DOC_INVEST,
+    (True, True): _DOC_BASE + _DOC_EXPERT + _DOC_INVEST,
+}
+
+# Static validation note and disclaimer appended to every explanation
+_DISCLAIMER_MD = """
+---
+
+## ⚠️ HUMAN VALIDATION NOTE
+
+**This is an automated screening recommendation only.** All routing decisions must be validated by claims personnel. The system cannot make final determinations on claim routing or handling.
+
+---
+
+## 🚨 DISCLAIMER
+
+**Synthetic screening logic - NOT for actual FNOL routing.**
+
+This tool demonstrates fictional claims screening using synthetic logic. No outputs shall be used for actual claim routing, processing, or handling decisions. All scenarios are fabricated for educational purposes.
+
+**Human claims professional review is mandatory.**
+"""
 
 def screen_fnol_claim(claim_source, loss_severity, incident_category):
     """
@@ -15,22 +60,7 @@ def screen_fnol_claim(claim_source, loss_severity, incident_category):
     """
     
     # Routing logic
-    if loss_severity <= 2 and claim_source in ['App', 'Call Center']:
-        route = "Fast Track"
-        route_color = "🟢"
-        priority = "Low"
-    elif loss_severity > 2 and incident_category in ['Auto Collision', 'Property']:
-        route = "Standard Review"
-        route_color = "🟡"
-        priority = "Medium"
-    elif loss_severity >= 4:
-        route = "Escalation"
-        route_color = "🔴"
-        priority = "High"
-    else:
-        route = "Standard Review"
-        route_color = "🟡"
-        priority = "Medium"
+    route, route_color, priority = ROUTES[route_claim(claim_source, loss_severity, incident_category)]
     
     # Calculate uncertainty (random ±0.1 for demonstration)
     base_uncertainty = 0.15 if loss_severity <= 2 else 0.25 if loss_severity <= 3 else 0.40
@@ -38,20 +68,7 @@ def screen_fnol_claim(claim_source, loss_severity, incident_category):
     uncertainty = max(0.0, min(1.0, uncertainty))
     
     # Required documents checklist
-    required_docs = [
-        "✓ Police report (if applicable)",
-        "✓ Photos of damage/incident",
-        "✓ Witness statements",
-        "✓ Medical records (if injury involved)"
-    ]
-    
-    if loss_severity >= 3:
-        required_docs.append("✓ Expert assessment required")
-    
-    if incident_category in ['Fire', 'Theft']:
-        required_docs.append("✓ Fire marshal/police investigation report")
-    
-    docs_checklist = "\n".join(required_docs)
+    docs_checklist = _DOCS[(loss_severity >= 3, incident_category in _INVEST_CATS)]
     
     # Build detailed explanation
     explanation = f"""# {route_color} FNOL Screening Result: {route}
@@ -107,23 +124,8 @@ def screen_fnol_claim(claim_source, loss_severity, incident_category):
 ## Required Documents Checklist
 
 {docs_checklist}
-
----
-
-## ⚠️ HUMAN VALIDATION NOTE
-
-**This is an automated screening recommendation only.** All routing decisions must be validated by claims personnel. The system cannot make final determinations on claim routing or handling.
-
----
-
-## 🚨 DISCLAIMER
-
-**Synthetic screening logic - NOT for actual FNOL routing.**
-
-This tool demonstrates fictional claims screening using synthetic logic. No outputs shall be used for actual claim routing, processing, or handling decisions. All scenarios are fabricated for educational purposes.
-
-**Human claims professional review is mandatory.**
 """
+    explanation += _DISCLAIMER_MD
     
     # Summary
     summary = f"""**Route:** {route_color} {route}
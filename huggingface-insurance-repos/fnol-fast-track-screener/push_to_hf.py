@@ -45,6 +45,18 @@ def push_space():
         else:
             print(f"⚠️ {filename} not found")
     
+    # Upload the shared FNOL routing package imported by app.py
+    shared_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "fnol_common")
+    print("Uploading fnol_common/...")
+    api.upload_folder(
+        folder_path=shared_dir,
+        path_in_repo="fnol_common",
+        repo_id=repo_id,
+        repo_type=repo_type,
+        allow_patterns=["*.py"]
+    )
+    print("✓ fnol_common/ uploaded")
+    
     print(f"\n✅ Repository {repo_id} has been updated on Hugging Face Hub!")
     print(f"URL: https://huggingface.co/spaces/{repo_id}")
 
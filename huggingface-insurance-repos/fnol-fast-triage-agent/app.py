@@ -1,38 +1,33 @@
 import gradio as gr
 import random
+import sys
+from pathlib import Path
+
+# Shared FNOL routing kernel (bundled next to app.py when deployed)
+sys.path.append(str(Path(__file__).parent.parent))
+from fnol_common import (
+    ROUTES, ROUTE_FAST_TRACK, ROUTE_STANDARD, ROUTE_ESCALATION, ROUTE_STANDARD_DEFAULT, route_claim
+)
+
+# Route code -> (estimated resolution, document checklist)
+_ROUTE_DETAILS = {
+    ROUTE_FAST_TRACK: ("1-3 days", "\n".join(["Claim form", "Initial photos"])),
+    ROUTE_STANDARD: ("3-7 days", "\n".join(["Claim form", "Photos", "Police report", "Estimates"])),
+    ROUTE_ESCALATION: ("7+ days", "\n".join(["Claim form", "Photos", "Police report", "Expert assessment", "Legal review"])),
+    ROUTE_STANDARD_DEFAULT: ("3-7 days", "\n".join(["Claim form", "Photos", "Witness statements"])),
+}
 
 def screen_fnol_claim(claim_source, loss_severity, incident_category):
     """Screen FNOL claim and recommend routing"""
     # Routing logic
-    if loss_severity <= 2 and claim_source in ['App', 'Call Center']:
-        route = "Fast Track"
-        route_color = "🟢"
-        priority = "Low"
-        estimated_resolution = "1-3 days"
-        document_checklist = ["Claim form", "Initial photos"]
-    elif loss_severity > 2 and incident_category in ['Auto Collision', 'Property']:
-        route = "Standard Review"
-        route_color = "🟡"
-        priority = "Medium"
-        estimated_resolution = "3-7 days"
-        document_checklist = ["Claim form", "Photos", "Police report", "Estimates"]
-    elif loss_severity >= 4:
-        route = "Escalation"
-        route_color = "🔴"
-        priority = "High"
-        estimated_resolution = "7+ days"
-        document_checklist = ["Claim form", "Photos", "Police report", "Expert assessment", "Legal review"]
-    else:
-        route = "Standard Review"
-        route_color = "🟡"
-        priority = "Medium"
-        estimated_resolution = "3-7 days"
-        document_checklist = ["Claim form", "Photos", "Witness statements"]
+    route_code = route_claim(claim_source, loss_severity, incident_category)
+    route, route_color, priority = ROUTES[route_code]
+    estimated_resolution, document_checklist = _ROUTE_DETAILS[route_code]
     
     # Uncertainty score
     uncertainty_score = round(random.uniform(0.1, 0.9), 2)
     
-    return route, route_color, priority, estimated_resolution, "\n".join(document_checklist), uncertainty_score
+    return route, route_color, priority, estimated_resolution, document_checklist, uncertainty_score
 
 with gr.Blocks(theme=gr.themes.Soft(), title="FNOL Fast Triage Agent") as demo:
     gr.Markdown("""
@@ -4,10 +4,11 @@ This script deploys the fnol-fast-triage-agent to Hugging Face Spaces
 """
 
 import os
-from huggingface_hub import HfApi, create_repo
 
 def deploy_to_hf():
     """Deploy to Hugging Face"""
+    from huggingface_hub import HfApi, create_repo
+    
     api = HfApi()
     
     # Repository details
@@ -47,6 +48,18 @@ def deploy_to_hf():
         else:
             print(f"⚠️ {filename} not found")
     
+    # Upload the shared FNOL routing package imported by app.py
+    shared_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "fnol_common")
+    print("Uploading fnol_common/...")
+    api.upload_folder(
+        folder_path=shared_dir,
+        path_in_repo="fnol_common",
+        repo_id=repo_id,
+        repo_type=repo_type,
+        allow_patterns=["*.py"]
+    )
+    print("✓ fnol_common/ uploaded")
+    
     print(f"\n✅ Repository {repo_id} has been updated on Hugging Face Hub!")
     print(f"URL: https://huggingface.co/spaces/{repo_id}")
 
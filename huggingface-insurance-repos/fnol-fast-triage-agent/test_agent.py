@@ -12,19 +12,14 @@ def test_imports():
         print("✗ Gradio import failed")
         return False
     
-    try:
-        import app
-        print("✓ App module import successful")
-    except ImportError as e:
-        print(f"✗ App module import failed: {e}")
-        return False
-    
     return True
 
 def test_app_structure():
     """Test that app has required structure"""
     try:
+        # Importing app builds the Gradio Blocks, so only do it here
         import app
+        print("✓ App module import successful")
         # Check if demo exists
         if hasattr(app, 'demo'):
             print("✓ App has demo object")
@@ -0,0 +1,16 @@
+# Shared FNOL routing kernel used by the FNOL screener Spaces
+from .screen import (
+    USE_NUMBA,
+    FAST_SOURCES,
+    STANDARD_CATS,
+    SOURCE_CODES,
+    CATEGORY_CODES,
+    ROUTE_FAST_TRACK,
+    ROUTE_STANDARD,
+    ROUTE_ESCALATION,
+    ROUTE_STANDARD_DEFAULT,
+    ROUTES,
+    encode_claims,
+    screen_fnol_batch,
+    route_claim,
+)
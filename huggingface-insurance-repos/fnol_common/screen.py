@@ -0,0 +1,104 @@
+"""
+FNOL Routing Kernel
+Shared routing rules for fnol-fast-track-screener and fnol-fast-triage-agent
+
+Part of gcc-insurance-intelligence-lab
+"""
+
+import numpy as np
+
+# Numba is optional: batch screening falls back to plain Python loops
+try:
+    from numba import njit, prange
+    USE_NUMBA = True
+except ImportError:
+    USE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Category/source sets used by the routing rules
+FAST_SOURCES = frozenset({'App', 'Call Center'})
+STANDARD_CATS = frozenset({'Auto Collision', 'Property'})
+
+# Integer encodings of the dropdown choices of both apps.
+# Unknown values map to len(choices), whose mask entry is False.
+SOURCE_CODES = {name: i for i, name in enumerate(
+    ['Call Center', 'App', 'Web', 'Agent', 'Email', 'Direct']
+)}
+CATEGORY_CODES = {name: i for i, name in enumerate(
+    ['Auto Collision', 'Auto Theft', 'Property', 'Fire', 'Water Damage', 'Theft',
+     'Liability', 'Workers Comp', 'General']
+)}
+_FAST_SOURCE_MASK = np.array(
+    [name in FAST_SOURCES for name in SOURCE_CODES] + [False], dtype=np.bool_
+)
+_STANDARD_CAT_MASK = np.array(
+    [name in STANDARD_CATS for name in CATEGORY_CODES] + [False], dtype=np.bool_
+)
+
+# Route codes returned by screen_fnol_batch -> (route, colour, priority).
+# ROUTE_STANDARD_DEFAULT is the catch-all standard review, kept separate
+# so apps can attach different follow-up details to it.
+ROUTE_FAST_TRACK, ROUTE_STANDARD, ROUTE_ESCALATION, ROUTE_STANDARD_DEFAULT = 0, 1, 2, 3
+ROUTES = (
+    ("Fast Track", "🟢", "Low"),
+    ("Standard Review", "🟡", "Medium"),
+    ("Escalation", "🔴", "High"),
+    ("Standard Review", "🟡", "Medium"),
+)
+
+
+@njit(parallel=True, cache=True)
+def _route_kernel(sources, severities, categories, fast_mask, standard_mask, out):
+    for i in prange(sources.shape[0]):
+        severity = severities[i]
+        if severity <= 2 and fast_mask[sources[i]]:
+            out[i] = 0
+        elif severity > 2 and standard_mask[categories[i]]:
+            out[i] = 1
+        elif severity >= 4:
+            out[i] = 2
+        else:
+            out[i] = 3
+
+
+def encode_claims(claim_sources, loss_severities, incident_categories):
+    """Encode claim fields into the int8 arrays expected by screen_fnol_batch"""
+    unknown_source = len(SOURCE_CODES)
+    unknown_category = len(CATEGORY_CODES)
+    sources = np.fromiter(
+        (SOURCE_CODES.get(s, unknown_source) for s in claim_sources), dtype=np.int8
+    )
+    categories = np.fromiter(
+        (CATEGORY_CODES.get(c, unknown_category) for c in incident_categories), dtype=np.int8
+    )
+    severities = np.asarray(loss_severities, dtype=np.int8)
+    return sources, severities, categories
+
+
+def screen_fnol_batch(sources, severities, categories):
+    """
+    Route a batch of encoded FNOL claims
+    
+    Args:
+        sources: int8 array of SOURCE_CODES values
+        severities: int8 array of severity ratings (1-5)
+        categories: int8 array of CATEGORY_CODES values
+    
+    Returns:
+        int8 array of route codes (index into ROUTES)
+    """
+    out = np.empty(sources.shape[0], dtype=np.int8)
+    _route_kernel(sources, severities, categories, _FAST_SOURCE_MASK, _STANDARD_CAT_MASK, out)
+    return out
+
+
+def route_claim(claim_source, loss_severity, incident_category):
+    """Route a single claim; a one-element call over screen_fnol_batch"""
+    return int(screen_fnol_batch(
+        *encode_claims([claim_source], [loss_severity], [incident_category])
+    )[0])
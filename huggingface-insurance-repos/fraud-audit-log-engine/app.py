@@ -2,15 +2,76 @@ import gradio as gr
 import json
 import datetime
 import os
+import itertools
+import re
+from collections import deque
 from typing import Dict, List
 
+# Number of recent entries kept in memory for the UI views
+RECENT_BUFFER_SIZE = 256
+# Size of the inline preview shown next to the export download
+EXPORT_PREVIEW_BYTES = 16 * 1024
+
+# Fixed-schema JSON line for audit entries, matching json.dumps output.
+# Only used when the free-text fields need no JSON escaping.
+_ENTRY_JSON_TMPL = (
+    '{"timestamp": "%s", "claim_id": "%s", "rule_hits": "%s", "ml_score": %r, '
+    '"session_id": "%s", "user_action": "audit_entry_created", '
+    '"source_system": "fraud-audit-log-engine", "version": "1.0"}\n'
+)
+_JSON_SAFE_RE = re.compile(r'[A-Za-z0-9 ,.:_\-]*')
+# Display fallbacks for keys missing from entries read back from the log
+_ENTRY_DEFAULTS = {
+    "timestamp": "N/A",
+    "claim_id": "N/A",
+    "rule_hits": "N/A",
+    "ml_score": "N/A",
+    "session_id": "N/A",
+}
+
 class FraudAuditLogger:
     def __init__(self, log_file="audit_log.jsonl"):
         self.log_file = log_file
+        self._recent = deque(maxlen=RECENT_BUFFER_SIZE)
+        # Log size the ring was last synced at; None forces the first read
+        self._log_size_last_seen = None
         # Create file if it doesn't exist
         if not os.path.exists(log_file):
             with open(log_file, 'w') as f:
                 pass  # Create empty file
+        # Warm the in-memory ring from the tail of the existing log
+        self.reload()
+    
+    def _log_size(self):
+        """Size of the log file in bytes (0 if it does not exist)"""
+        try:
+            return os.stat(self.log_file).st_size
+        except FileNotFoundError:
+            return 0
+    
+    def reload(self, force=False):
+        """Re-read the tail of the log file into the in-memory ring"""
+        size = self._log_size()
+        # Skip the read when the file has not changed since the last sync
+        if not force and size == self._log_size_last_seen:
+            return
+        
+        self._recent.clear()
+        self._log_size_last_seen = size
+        if size == 0:
+            return
+        
+        with open(self.log_file, 'r') as f:
+            tail = deque(f, maxlen=RECENT_BUFFER_SIZE)
+        
+        for line in tail:
+            try:
+                entry = json.loads(line.strip())
+            except json.JSONDecodeError:
+                continue
+            # Older or hand-edited lines may lack keys the views format
+            if isinstance(entry, dict):
+                self._recent.append({**_ENTRY_DEFAULTS, **entry})
     
     def write_audit_entry(self, claim_id, rule_hits, ml_score):
         """Write an audit entry to the log file"""
@@ -26,93 +87,112 @@ class FraudAuditLogger:
         }
         
         with open(self.log_file, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+            f.write(self._serialize(entry))
+            self._log_size_last_seen = f.tell()
         
+        self._recent.append(entry)
         return entry
     
+    @staticmethod
+    def _serialize(entry):
+        """Serialize an entry to a JSONL line, skipping the encoder when safe"""
+        if (
+            type(entry["claim_id"]) is str
+            and type(entry["rule_hits"]) is str
+            and type(entry["ml_score"]) is float
+            and 0.0 <= entry["ml_score"] <= 1.0
+            and _JSON_SAFE_RE.fullmatch(entry["claim_id"])
+            and _JSON_SAFE_RE.fullmatch(entry["rule_hits"])
+        ):
+            return _ENTRY_JSON_TMPL % (
+                entry["timestamp"], entry["claim_id"], entry["rule_hits"],
+                entry["ml_score"], entry["session_id"]
+            )
+        return json.dumps(entry) + '\n'
+    
     def get_recent_entries(self, count=50):
-        """Get the most recent audit entries"""
-        if not os.path.exists(self.log_file):
-            return []
-        
-        entries = []
-        with open(self.log_file, 'r') as f:
-            lines = f.readlines()
-            # Get last 'count' lines
-            recent_lines = lines[-count:] if len(lines) >= count else lines
-        
-        for line in recent_lines:
-            try:
-                entry = json.loads(line.strip())
-                entries.append(entry)
-            except json.JSONDecodeError:
-                continue
-        
-        # Sort by timestamp (most recent first)
-        entries.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        return entries
+        """Get the most recent audit entries (most recent first)"""
+        # Entries are appended in chronological order, so the ring is
+        # already sorted - serve it newest-first without touching disk
+        return list(itertools.islice(reversed(self._recent), count))
     
     def export_logs(self):
-        """Export all logs as downloadable content"""
-        if not os.path.exists(self.log_file):
-            return "[]"
+        """Export all logs as a downloadable file path (streamed from disk)"""
+        if self._log_size() == 0:
+            return None
         
-        with open(self.log_file, 'r') as f:
-            content = f.read()
-        
-        return content
+        return os.path.abspath(self.log_file)
+    
+    def tail_preview(self, max_bytes=EXPORT_PREVIEW_BYTES):
+        """Read only the trailing bytes of the log for an inline preview"""
+        size = self._log_size()
+        if size == 0:
+            return ""
+        
+        offset = max(0, size - max_bytes)
+        fd = os.open(self.log_file, os.O_RDONLY)
+        try:
+            data = os.pread(fd, size - offset, offset)
+        finally:
+            os.close(fd)
+        
+        text = data.decode('utf-8', errors='replace')
+        if offset:
+            # Drop the partial first line when the preview starts mid-file
+            text = text.split('\n', 1)[-1]
+        return text
 
 # Initialize logger
 logger = FraudAuditLogger()
 
+# Display templates; write_audit_entry and reload guarantee every key is present
+_SUMMARY_TMPL = "[{timestamp}] Claim: {claim_id} | Rules: {rule_hits} | ML: {ml_score}"
+_DETAILED_TMPL = """
+**Timestamp:** {timestamp}
+**Claim ID:** {claim_id}
+**Rule Hits:** {rule_hits}
+**ML Score:** {ml_score}
+**Session:** {session_id}
+---
+"""
+
 def add_audit_entry(claim_id, rule_hits, ml_score):
     """Add a new audit entry"""
+    # Validate inputs
+    if not claim_id:
+        return "Error: Claim ID is required", "", "Error"
+    
+    # Ensure ml_score is between 0 and 1 (gr.Number yields a float or None)
+    if not isinstance(ml_score, (int, float)):
+        ml_score = 0.0
+    ml_score = max(0.0, min(1.0, float(ml_score)))
+    
+    # Write audit entry - disk I/O is the only expected failure
     try:
-        # Validate inputs
-        if not claim_id:
-            return "Error: Claim ID is required", "", "Error"
-        
-        # Ensure ml_score is between 0 and 1
-        try:
-            ml_score = float(ml_score) if ml_score else 0.0
-            ml_score = max(0.0, min(1.0, ml_score))
-        except ValueError:
-            ml_score = 0.0
-        
-        # Write audit entry
         entry = logger.write_audit_entry(claim_id, rule_hits, ml_score)
-        
-        # Get recent entries
-        recent_entries = logger.get_recent_entries(10)  # Show last 10
-        
-        # Format recent entries for display
-        formatted_entries = []
-        for entry in recent_entries[:10]:  # Limit to 10 for display
-            formatted_entries.append(
-                f"[{entry.get('timestamp', '')}] Claim: {entry.get('claim_id', '')} | "
-                f"Rules: {entry.get('rule_hits', '')} | ML: {entry.get('ml_score', '')}"
-            )
-        
-        recent_display = "\n".join(formatted_entries) if formatted_entries else "No recent entries found."
-        
-        # Success message
-        message = f"Audit entry added successfully for Claim ID: {claim_id}"
-        
-        # Summary
-        summary = f"""**Audit Entry Added:** ✓
+    except OSError as e:
+        error_msg = f"Error adding audit entry: {str(e)}"
+        return error_msg, "", error_msg
+    
+    # Format the last 10 entries for display in one pass
+    recent_display = "\n".join(
+        _SUMMARY_TMPL.format_map(e) for e in logger.get_recent_entries(10)
+    ) or "No recent entries found."
+    
+    # Success message
+    message = f"Audit entry added successfully for Claim ID: {claim_id}"
+    
+    # Summary
+    summary = f"""**Audit Entry Added:** ✓
 **Claim ID:** {claim_id}
 **Rule Hits:** {rule_hits}
 **ML Score:** {ml_score}
-**Timestamp:** {entry.get('timestamp', '')}
+**Timestamp:** {entry['timestamp']}
 
 **Recent Entries:**
 {recent_display}"""
-        
-        return message, recent_display, summary
-        
-    except Exception as e:
-        error_msg = f"Error adding audit entry: {str(e)}"
-        return error_msg, "", error_msg
+    
+    return message, recent_display, summary
 
 def view_recent_logs():
     """View recent audit logs"""
@@ -123,29 +203,12 @@ def view_recent_logs():
             return "No audit entries found in the log file.", "No recent entries"
         
         # Format for detailed display
-        detailed_display = []
-        for entry in recent_entries:
-            detailed_display.append(f"""
-**Timestamp:** {entry.get('timestamp', 'N/A')}
-**Claim ID:** {entry.get('claim_id', 'N/A')}
-**Rule Hits:** {entry.get('rule_hits', 'N/A')}
-**ML Score:** {entry.get('ml_score', 'N/A')}
-**Session:** {entry.get('session_id', 'N/A')}
----
-""")
-        
-        detailed_str = "\n".join(detailed_display)
+        detailed_str = "\n".join(_DETAILED_TMPL.format_map(e) for e in recent_entries)
         
         # Format for summary display (last 10)
-        summary_entries = recent_entries[:10]
-        summary_display = []
-        for entry in summary_entries:
-            summary_display.append(
-                f"[{entry.get('timestamp', '')}] Claim: {entry.get('claim_id', '')} | "
-                f"Rules: {entry.get('rule_hits', '')} | ML: {entry.get('ml_score', '')}"
-            )
-        
-        summary_str = "\n".join(summary_display) if summary_display else "No recent entries."
+        summary_str = "\n".join(
+            _SUMMARY_TMPL.format_map(e) for e in recent_entries[:10]
+        ) or "No recent entries."
         
         return detailed_str, summary_str
         
@@ -155,13 +218,14 @@ def view_recent_logs():
 def export_audit_logs():
     """Export audit logs"""
     try:
-        content = logger.export_logs()
-        if content.strip():
-            return content, "Logs exported successfully"
+        path = logger.export_logs()
+        preview = logger.tail_preview()
+        if path and preview.strip():
+            return path, preview, "Logs exported successfully"
         else:
-            return "[]", "No logs to export"
+            return None, "[]", "No logs to export"
     except Exception as e:
-        return f"Error exporting logs: {str(e)}", f"Export failed: {str(e)}"
+        return None, f"Error exporting logs: {str(e)}", f"Export failed: {str(e)}"
 
 # Create Gradio interface
 with gr.Blocks(title="Fraud Audit Log Engine", theme=gr.themes.Soft()) as demo:
@@ -250,9 +314,12 @@ with gr.Blocks(title="Fraud Audit Log Engine", theme=gr.themes.Soft()) as demo:
         with gr.Row():
             export_btn = gr.Button("📥 Export JSONL", variant="secondary")
         
+        with gr.Row():
+            export_file = gr.File(label="audit_log.jsonl")
+        
         with gr.Row():
             export_output = gr.Textbox(
-                label="Exported Data",
+                label="Preview (last 16 KB)",
                 lines=15,
                 interactive=False
             )
@@ -280,7 +347,7 @@ with gr.Blocks(title="Fraud Audit Log Engine", theme=gr.themes.Soft()) as demo:
     export_btn.click(
         fn=export_audit_logs,
         inputs=[],
-        outputs=[export_output, export_status]
+        outputs=[export_file, export_output, export_status]
     )
     
     with gr.Accordion("ℹ️ About This Tool", open=False):
@@ -3,7 +3,6 @@
 Deploy fraud-signal-classifier-v1 to Hugging Face Hub
 """
 
-from huggingface_hub import HfApi, create_repo, upload_file, upload_folder
 import os
 
 # Configuration
@@ -13,6 +12,7 @@ REPO_TYPE = "model"
 # Files to upload
 FILES_TO_UPLOAD = [
     "model.pkl",
+    "model.onnx",
     "label_encoders.pkl",
     "feature_names.json",
     "train_model.py",
@@ -30,6 +30,9 @@ def deploy_model():
     print("DEPLOYING fraud-signal-classifier-v1 TO HUGGING FACE")
     print("="*60)
     
+    # Imported here so the module loads without huggingface_hub installed
+    from huggingface_hub import HfApi, create_repo
+    
     # Initialize API
     api = HfApi()
     
@@ -48,22 +51,28 @@ def deploy_model():
     
     # Upload files
     print(f"\n2. Uploading model artifacts...")
+    present = []
     for filename in FILES_TO_UPLOAD:
         if os.path.exists(filename):
-            try:
-                print(f"   Uploading {filename}...")
-                upload_file(
-                    path_or_fileobj=filename,
-                    path_in_repo=filename,
-                    repo_id=REPO_ID,
-                    repo_type=REPO_TYPE
-                )
-                print(f"   ✓ {filename} uploaded")
-            except Exception as e:
-                print(f"   ✗ Failed to upload {filename}: {e}")
+            present.append(filename)
         else:
             print(f"   ⚠️  {filename} not found, skipping")
     
+    # Single commit for all artifacts; allow_patterns skips anything missing
+    try:
+        print(f"   Uploading {len(present)} files in one commit...")
+        api.upload_folder(
+            folder_path=".",
+            allow_patterns=FILES_TO_UPLOAD,
+            repo_id=REPO_ID,
+            repo_type=REPO_TYPE,
+            commit_message="Deploy fraud-signal-classifier-v1"
+        )
+        for filename in present:
+            print(f"   ✓ {filename} uploaded")
+    except Exception as e:
+        print(f"   ✗ Failed to upload model artifacts: {e}")
+    
     # Print success message
     print("\n" + "="*60)
     print("✅ DEPLOYMENT COMPLETE")
@@ -16,25 +16,131 @@ import json
 import os
 from typing import Dict, Tuple, List
 
+# Numba is optional: the scoring post-process falls back to plain Python
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Fraud score weight per class (weighted by severity); unknown classes get 0.5
+FRAUD_SCORE_MAP = {
+    'Clean': 0.0,
+    'Under Review': 0.33,
+    'Flagged': 0.66,
+    'Confirmed Fraud': 1.0
+}
+BUCKETS = ("Low", "Medium", "High")
+REVIEW_WARNING = '⚠️  HUMAN REVIEW REQUIRED - Educational model only'
+
+
+@njit(cache=True)
+def _postprocess(probs, weights):
+    """Return (fraud_score, confidence, predicted index, bucket index)"""
+    score = 0.0
+    best = -1.0
+    best_idx = 0
+    for i in range(probs.shape[0]):
+        score += probs[i] * weights[i]
+        if probs[i] > best:
+            best = probs[i]
+            best_idx = i
+    if score < 0.3:
+        bucket_idx = 0
+    elif score < 0.6:
+        bucket_idx = 1
+    else:
+        bucket_idx = 2
+    return score, best, best_idx, bucket_idx
+
+
+@njit(cache=True)
+def _forest_predict_proba(children_left, children_right, feature, threshold, leaf_probs, x):
+    """Average the leaf class distributions of every tree for one row"""
+    n_trees = children_left.shape[0]
+    out = np.zeros(leaf_probs.shape[2])
+    for t in range(n_trees):
+        node = 0
+        while children_left[t, node] != -1:
+            if x[feature[t, node]] <= threshold[t, node]:
+                node = children_left[t, node]
+            else:
+                node = children_right[t, node]
+        out += leaf_probs[t, node]
+    return out / n_trees
+
+
+@njit(cache=True)
+def _forest_predict_proba_batch(children_left, children_right, feature, threshold, leaf_probs, X):
+    """_forest_predict_proba for every row of X (same arithmetic, row by row)"""
+    out = np.empty((X.shape[0], leaf_probs.shape[2]))
+    for i in range(X.shape[0]):
+        out[i] = _forest_predict_proba(children_left, children_right, feature, threshold, leaf_probs, X[i])
+    return out
+
+
+@njit(cache=True)
+def _postprocess_batch(probs, weights, scores, confidences, pred_idx, bucket_idx):
+    """_postprocess for every row of probs, filling the four output arrays"""
+    for i in range(probs.shape[0]):
+        score, best, best_idx, bucket = _postprocess(probs[i], weights)
+        scores[i] = score
+        confidences[i] = best
+        pred_idx[i] = best_idx
+        bucket_idx[i] = bucket
+
+
+def _flatten_forest(forest):
+    """Stack a fitted forest's trees into (n_trees, max_nodes) arrays padded with leaves"""
+    trees = [estimator.tree_ for estimator in forest.estimators_]
+    n_trees = len(trees)
+    max_nodes = max(tree.node_count for tree in trees)
+    n_classes = trees[0].value.shape[2]
+    
+    children_left = np.full((n_trees, max_nodes), -1, dtype=np.int32)
+    children_right = np.full((n_trees, max_nodes), -1, dtype=np.int32)
+    feature = np.zeros((n_trees, max_nodes), dtype=np.int32)
+    threshold = np.zeros((n_trees, max_nodes), dtype=np.float64)
+    leaf_probs = np.zeros((n_trees, max_nodes, n_classes), dtype=np.float64)
+    
+    for t, tree in enumerate(trees):
+        n = tree.node_count
+        children_left[t, :n] = tree.children_left
+        children_right[t, :n] = tree.children_right
+        feature[t, :n] = np.maximum(tree.feature, 0)
+        threshold[t, :n] = tree.threshold
+        value = tree.value[:, 0, :]
+        leaf_probs[t, :n] = value / value.sum(axis=1, keepdims=True)
+    
+    return children_left, children_right, feature, threshold, leaf_probs
+
+
 class FraudSignalClassifier:
     """Fraud Signal Classifier for inference"""
     
-    def __init__(self, model_path="model.pkl", encoder_path="label_encoders.pkl"):
+    def __init__(self, model_path="model.pkl", encoder_path="label_encoders.pkl",
+                 onnx_path="model.onnx"):
         """
         Initialize the classifier with trained model and encoders
         
         Args:
             model_path: Path to the trained model pickle file
             encoder_path: Path to the label encoders pickle file
+            onnx_path: Optional ONNX export of the model, served with onnxruntime
         """
         self.model = None
         self.encoders = None
         self.feature_encoders = None
         self.target_encoder = None
         
-        self.load_model(model_path, encoder_path)
+        self.load_model(model_path, encoder_path, onnx_path)
     
-    def load_model(self, model_path, encoder_path):
+    def load_model(self, model_path, encoder_path, onnx_path="model.onnx"):
         """Load trained model and encoders"""
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Model file not found: {model_path}")
@@ -42,15 +148,65 @@ class FraudSignalClassifier:
             raise FileNotFoundError(f"Encoder file not found: {encoder_path}")
         
         print(f"📦 Loading model from {model_path}")
-        self.model = joblib.load(model_path)
+        # Memory-map the tree arrays: read-only at inference, paged in lazily
+        # and shared between worker processes (requires an uncompressed pickle)
+        self.model = joblib.load(model_path, mmap_mode='r')
         
         print(f"📦 Loading encoders from {encoder_path}")
         self.encoders = joblib.load(encoder_path)
         self.feature_encoders = self.encoders['feature_encoders']
         self.target_encoder = self.encoders['target_encoder']
         
+        # Dict lookup tables for single-row encoding (LabelEncoder.transform
+        # validates and builds arrays on every call)
+        self._fast_maps = {
+            name: {cls: i for i, cls in enumerate(encoder.classes_)}
+            for name, encoder in self.feature_encoders.items()
+        }
+        self._inv_target = self.target_encoder.classes_
+        # Immutable, so predict_proba can hand the same labels to every caller
+        self._class_labels = tuple(self.target_encoder.classes_.tolist())
+        # Score weights aligned with the model's class order
+        self._score_weights = np.array(
+            [FRAUD_SCORE_MAP.get(label, 0.5) for label in self._class_labels],
+            dtype=np.float64
+        )
+        # Compile the scoring post-process now rather than on the first request
+        _postprocess(np.zeros(len(self._class_labels)), self._score_weights)
+        
+        # With numba, single rows are scored by walking flattened tree arrays
+        # directly, skipping sklearn's per-call validation and dispatch
+        self._forest = None
+        if _NUMBA_AVAILABLE:
+            self._forest = _flatten_forest(self.model)
+            _forest_predict_proba(*self._forest, np.zeros(self.model.n_features_in_, dtype=np.float32))
+        
+        # Otherwise prefer the ONNX export (if present) over sklearn
+        self._onnx_session = None
+        if self._forest is None and os.path.exists(onnx_path):
+            try:
+                import onnxruntime
+            except ImportError:
+                onnxruntime = None
+            if onnxruntime is not None:
+                print(f"📦 Loading ONNX model from {onnx_path}")
+                options = onnxruntime.SessionOptions()
+                options.intra_op_num_threads = 1
+                self._onnx_session = onnxruntime.InferenceSession(
+                    onnx_path, options, providers=['CPUExecutionProvider']
+                )
+                self._onnx_input = self._onnx_session.get_inputs()[0].name
+        
         print("✅ Model and encoders loaded successfully")
     
+    def _encode_category(self, column: str, value: str) -> int:
+        """Look up the label code for a categorical value (0 if unknown)"""
+        code = self._fast_maps[column].get(value)
+        if code is None:
+            print(f"⚠️  Unknown {column} '{value}', using default")
+            return 0
+        return code
+    
     def encode_input(self, policy_type: str, claimant_profile_risk: str, 
                     incident_pattern: str, document_consistency_score: float, 
                     anomaly_score: float) -> np.ndarray:
@@ -68,38 +224,24 @@ class FraudSignalClassifier:
             Encoded feature array
         """
         # Encode categorical features
-        try:
-            policy_encoded = self.feature_encoders['policy_type'].transform([policy_type])[0]
-        except ValueError:
-            print(f"⚠️  Unknown policy_type '{policy_type}', using default")
-            policy_encoded = 0
-        
-        try:
-            risk_encoded = self.feature_encoders['claimant_profile_risk'].transform([claimant_profile_risk])[0]
-        except ValueError:
-            print(f"⚠️  Unknown claimant_profile_risk '{claimant_profile_risk}', using default")
-            risk_encoded = 0
-        
-        try:
-            pattern_encoded = self.feature_encoders['incident_pattern'].transform([incident_pattern])[0]
-        except ValueError:
-            print(f"⚠️  Unknown incident_pattern '{incident_pattern}', using default")
-            pattern_encoded = 0
+        policy_encoded = self._encode_category('policy_type', policy_type)
+        risk_encoded = self._encode_category('claimant_profile_risk', claimant_profile_risk)
+        pattern_encoded = self._encode_category('incident_pattern', incident_pattern)
         
-        # Combine features
+        # Combine features (float32: the dtype the trees compare against)
         features = np.array([[
             policy_encoded,
             risk_encoded,
             pattern_encoded,
             document_consistency_score,
             anomaly_score
-        ]])
+        ]], dtype=np.float32)
         
         return features
     
     def predict_proba(self, policy_type: str, claimant_profile_risk: str, 
                      incident_pattern: str, document_consistency_score: float, 
-                     anomaly_score: float) -> Tuple[np.ndarray, List[str]]:
+                     anomaly_score: float) -> Tuple[np.ndarray, Tuple[str, ...]]:
         """
         Predict fraud probability for given input
         
@@ -111,10 +253,28 @@ class FraudSignalClassifier:
             document_consistency_score, anomaly_score
         )
         
-        probabilities = self.model.predict_proba(features)[0]
-        class_labels = self.target_encoder.classes_.tolist()
+        if self._forest is not None:
+            probabilities = _forest_predict_proba(*self._forest, features[0])
+        elif self._onnx_session is not None:
+            outputs = self._onnx_session.run(None, {self._onnx_input: features})
+            probabilities = outputs[1][0].astype(np.float64)
+        else:
+            probabilities = self.model.predict_proba(features)[0]
         
-        return probabilities, class_labels
+        return probabilities, self._class_labels
+    
+    def _predict_proba_matrix(self, features: np.ndarray) -> np.ndarray:
+        """
+        Class probabilities for every row of an encoded feature matrix, from
+        the same backend and arithmetic as predict_proba, so batch and
+        single-row results agree exactly
+        """
+        if self._forest is not None:
+            return _forest_predict_proba_batch(*self._forest, features)
+        if self._onnx_session is not None:
+            outputs = self._onnx_session.run(None, {self._onnx_input: features})
+            return np.asarray(outputs[1]).astype(np.float64)
+        return self.model.predict_proba(features)
     
     def predict(self, policy_type: str, claimant_profile_risk: str, 
                incident_pattern: str, document_consistency_score: float, 
@@ -149,49 +309,73 @@ class FraudSignalClassifier:
             document_consistency_score, anomaly_score
         )
         
-        # Get predicted class
-        predicted_class = self.predict(
-            policy_type, claimant_profile_risk, incident_pattern,
-            document_consistency_score, anomaly_score
+        # Weighted fraud score (see FRAUD_SCORE_MAP), confidence (max
+        # probability), predicted class and bucket in one pass. The predicted
+        # class is the argmax, as RandomForest.predict would return.
+        fraud_score, confidence, pred_idx, bucket_idx = _postprocess(
+            probabilities, self._score_weights
         )
         
-        # Calculate fraud score (weighted by severity)
-        # Clean=0, Under Review=0.33, Flagged=0.66, Confirmed Fraud=1.0
-        fraud_score_map = {
-            'Clean': 0.0,
-            'Under Review': 0.33,
-            'Flagged': 0.66,
-            'Confirmed Fraud': 1.0
+        return {
+            'fraud_score': round(float(fraud_score), 3),
+            'bucket': BUCKETS[bucket_idx],
+            'predicted_class': self._class_labels[pred_idx],
+            'confidence': round(float(confidence), 3),
+            # tolist() already yields Python floats
+            'probabilities': dict(zip(class_labels, probabilities.tolist())),
+            'warning': REVIEW_WARNING
         }
+    
+    def predict_batch(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Get fraud assessments for many inputs with a single model call
         
-        # Calculate weighted fraud score
-        fraud_score = sum(prob * fraud_score_map.get(label, 0.5) 
-                         for prob, label in zip(probabilities, class_labels))
-        
-        # Map to bucket (Low, Medium, High)
-        if fraud_score < 0.3:
-            bucket = "Low"
-        elif fraud_score < 0.6:
-            bucket = "Medium"
-        else:
-            bucket = "High"
+        Args:
+            rows: List of dicts with the same keys as get_fraud_score_and_bucket's
+                  arguments. Unknown categorical values are encoded as 0.
         
-        # Get confidence (max probability)
-        confidence = max(probabilities)
+        Returns:
+            List of result dictionaries, in the same format as get_fraud_score_and_bucket
+        """
+        n = len(rows)
+        if n == 0:
+            return []
         
-        # Build probability dict
-        prob_dict = {label: float(prob) for label, prob in zip(class_labels, probabilities)}
+        # Encode all rows column-wise into one feature matrix
+        columns = [
+            np.fromiter((self._fast_maps[col].get(r[col], 0) for r in rows), dtype=np.float32, count=n)
+            for col in ('policy_type', 'claimant_profile_risk', 'incident_pattern')
+        ]
+        columns += [
+            np.fromiter((r[col] for r in rows), dtype=np.float32, count=n)
+            for col in ('document_consistency_score', 'anomaly_score')
+        ]
+        features = np.column_stack(columns)
         
-        result = {
-            'fraud_score': round(fraud_score, 3),
-            'bucket': bucket,
-            'predicted_class': predicted_class,
-            'confidence': round(confidence, 3),
-            'probabilities': prob_dict,
-            'warning': '⚠️  HUMAN REVIEW REQUIRED - Educational model only'
-        }
+        # Probabilities and post-process computed exactly as in the single-row
+        # path, so rounding never lands on the other side of a boundary
+        probabilities = np.ascontiguousarray(self._predict_proba_matrix(features), dtype=np.float64)
+        fraud_scores = np.empty(n, dtype=np.float64)
+        confidences = np.empty(n, dtype=np.float64)
+        pred_idx = np.empty(n, dtype=np.int64)
+        bucket_idx = np.empty(n, dtype=np.int64)
+        _postprocess_batch(probabilities, self._score_weights,
+                           fraud_scores, confidences, pred_idx, bucket_idx)
         
-        return result
+        return [
+            {
+                'fraud_score': round(score, 3),
+                'bucket': BUCKETS[bucket],
+                'predicted_class': self._class_labels[idx],
+                'confidence': round(conf, 3),
+                'probabilities': dict(zip(self._class_labels, probs)),
+                'warning': REVIEW_WARNING
+            }
+            for score, bucket, idx, conf, probs in zip(
+                fraud_scores.tolist(), bucket_idx.tolist(), pred_idx.tolist(),
+                confidences.tolist(), probabilities.tolist()
+            )
+        ]
     
     def get_available_values(self) -> Dict:
         """Get available values for categorical features"""
@@ -5,7 +5,7 @@ This script uploads the trained model and all artifacts to Hugging Face
 under the gcc-insurance-intelligence-lab organization.
 """
 
-from huggingface_hub import HfApi, create_repo, upload_file, upload_folder
+from huggingface_hub import HfApi, create_repo
 import os
 
 # Configuration
@@ -59,18 +59,19 @@ def push_to_huggingface():
         )
         print(f"✓ Repository ready: {REPO_ID}")
         
-        # Upload files
+        # Upload files (single commit, file data sent in parallel). Files whose
+        # content hash already matches the Hub copy are dropped from the commit
         print(f"\n📤 Uploading files to Hugging Face...")
         
+        api.upload_folder(
+            folder_path=LOCAL_DIR,
+            repo_id=REPO_ID,
+            repo_type=REPO_TYPE,
+            allow_patterns=required_files,
+            commit_message="Publish fraud-signal-classifier-v1",
+        )
         for file in required_files:
-            print(f"  Uploading {file}...")
-            upload_file(
-                path_or_fileobj=file,
-                path_in_repo=file,
-                repo_id=REPO_ID,
-                repo_type=REPO_TYPE,
-            )
-            print(f"  ✓ {file} uploaded")
+            print(f"  ✓ {file} synced")
         
         print("\n" + "=" * 70)
         print("✅ SUCCESS: fraud-signal-classifier-v1 published successfully")
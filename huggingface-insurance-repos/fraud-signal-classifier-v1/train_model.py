@@ -28,6 +28,7 @@ import json
 # Configuration
 DATA_PATH = "../insurance-datasets-synthetic/data/fraud_cases_synthetic.csv"
 MODEL_OUTPUT_PATH = "model.pkl"
+ONNX_OUTPUT_PATH = "model.onnx"
 ENCODER_OUTPUT_PATH = "label_encoders.pkl"
 FEATURE_NAMES_PATH = "feature_names.json"
 
@@ -46,22 +47,39 @@ def load_and_prepare_data(data_path):
     return df
 
 def encode_categorical_features(df):
-    """Encode categorical features using LabelEncoder"""
+    """
+    Build the float32 feature matrix, encoding categorical features as
+    LabelEncoder-compatible codes
+
+    Returns (X, label_encoders, feature_cols)
+    """
     print("\n🔄 Encoding categorical features...")
     
     label_encoders = {}
-    df_encoded = df.copy()
     
-    # Categorical columns to encode
+    # Categorical columns to encode, followed by the numeric features
     categorical_cols = ['policy_type', 'claimant_profile_risk', 'incident_pattern']
+    numeric_cols = ['document_consistency_score', 'anomaly_score']
+    feature_cols = categorical_cols + numeric_cols
+    
+    # Fill one contiguous float32 buffer instead of copying the DataFrame;
+    # float32 is what the tree splits compare against at predict time
+    X = np.empty((len(df), len(feature_cols)), dtype=np.float32)
     
-    for col in categorical_cols:
+    for i, col in enumerate(categorical_cols):
+        # pd.Categorical hashes the column once; its sorted categories match
+        # LabelEncoder.classes_, so the pickled encoders stay compatible
+        cat = pd.Categorical(df[col])
         le = LabelEncoder()
-        df_encoded[col] = le.fit_transform(df[col])
+        le.classes_ = np.asarray(cat.categories)
+        X[:, i] = cat.codes
         label_encoders[col] = le
         print(f"  ✓ Encoded {col}: {len(le.classes_)} unique values")
     
-    return df_encoded, label_encoders
+    for i, col in enumerate(numeric_cols, start=len(categorical_cols)):
+        X[:, i] = df[col].to_numpy(dtype=np.float32)
+    
+    return X, label_encoders, feature_cols
 
 def train_classifier(X_train, y_train):
     """Train Random Forest Classifier"""
@@ -73,11 +91,15 @@ def train_classifier(X_train, y_train):
         max_depth=10,
         min_samples_split=5,
         min_samples_leaf=2,
+        max_leaf_nodes=64,  # Bound tree size for a smaller pickle and faster predict
+        n_jobs=-1,
         random_state=42,
         class_weight='balanced'  # Handle class imbalance
     )
     
     clf.fit(X_train, y_train)
+    # Parallelism only pays off for fitting; single-row inference stays serial
+    clf.set_params(n_jobs=None)
     print("✓ Model trained successfully")
     
     return clf
@@ -116,10 +138,27 @@ def save_model_artifacts(clf, label_encoders, target_encoder, feature_names):
     """Save model and encoders"""
     print("\n💾 Saving model artifacts...")
     
-    # Save the trained model
-    joblib.dump(clf, MODEL_OUTPUT_PATH)
+    # Save the trained model uncompressed so inference can memory-map it
+    # (compression would rule out mmap_mode='r' at load time)
+    joblib.dump(clf, MODEL_OUTPUT_PATH, compress=0, protocol=5)
     print(f"  ✓ Model saved to {MODEL_OUTPUT_PATH}")
     
+    # Export an ONNX copy for onnxruntime serving (optional dependency)
+    try:
+        from skl2onnx import to_onnx
+    except ImportError:
+        print(f"  ⚠️  skl2onnx not installed, skipping {ONNX_OUTPUT_PATH}")
+    else:
+        onx = to_onnx(
+            clf,
+            np.zeros((1, len(feature_names)), dtype=np.float32),
+            target_opset=17,
+            options={'zipmap': False}
+        )
+        with open(ONNX_OUTPUT_PATH, 'wb') as f:
+            f.write(onx.SerializeToString())
+        print(f"  ✓ ONNX model saved to {ONNX_OUTPUT_PATH}")
+    
     # Save encoders (including target encoder)
     encoders_dict = {
         'feature_encoders': label_encoders,
@@ -145,18 +184,13 @@ def main():
     df = load_and_prepare_data(DATA_PATH)
     
     # Encode categorical features
-    df_encoded, label_encoders = encode_categorical_features(df)
-    
-    # Prepare features and target
-    feature_cols = ['policy_type', 'claimant_profile_risk', 'incident_pattern', 
-                   'document_consistency_score', 'anomaly_score']
-    
-    X = df_encoded[feature_cols].values
-    y = df_encoded['synthetic_flag_label'].values
+    X, label_encoders, feature_cols = encode_categorical_features(df)
     
     # Encode target variable
+    target = pd.Categorical(df['synthetic_flag_label'])
     target_encoder = LabelEncoder()
-    y_encoded = target_encoder.fit_transform(y)
+    target_encoder.classes_ = np.asarray(target.categories)
+    y_encoded = target.codes.astype(np.int64)
     
     print(f"\n✓ Features shape: {X.shape}")
     print(f"✓ Target classes: {list(target_encoder.classes_)}")
@@ -183,6 +217,8 @@ def main():
     print("=" * 60)
     print("\n📦 Generated files:")
     print(f"  - {MODEL_OUTPUT_PATH}")
+    if os.path.exists(ONNX_OUTPUT_PATH):
+        print(f"  - {ONNX_OUTPUT_PATH}")
     print(f"  - {ENCODER_OUTPUT_PATH}")
     print(f"  - {FEATURE_NAMES_PATH}")
     print("\n🎯 Next steps:")
@@ -4,225 +4,270 @@ Auto-update gcc-insurance-ai-hub with newly published Spaces
 """
 
 import os
-import json
 from pathlib import Path
 import re
-from datetime import datetime
+
+SPACES_HEADING = "## Available Insurance AI Spaces"
+DATASETS_HEADING = "## Available Datasets"
+MODELS_HEADING = "## Available Models"
+
+# Files a directory must contain to be published as a Space
+REQUIRED_SPACE_FILES = frozenset({'app.py', 'README.md', 'model_card.md', 'requirements.txt'})
+
+# Zero-width split point before every H2 heading line
+_SECTION_SPLIT_RE = re.compile(r'(?=^## )', re.M)
 
 class HubOrchestrator:
     """
     Auto-update gcc-insurance-ai-hub with newly published Spaces
     """
-    
+
     def __init__(self, hub_path="gcc-insurance-ai-hub", spaces_base_path="."):
         self.hub_path = Path(hub_path)
         self.spaces_base_path = Path(spaces_base_path)
         self.index_file = self.hub_path / "README.md"
-        
+
         # Define known spaces to look for
         self.known_spaces = [
             "underwriting-score-sandbox",
-            "fnol-fast-track-screener", 
+            "fnol-fast-track-screener",
             "claims-journey-simulator",
             "reinsurance-pricing-mock",
             "fraud-audit-log-engine",
             "fraud-triage-sandbox",
             "fraud-signal-classifier-v1"
         ]
-    
-    def find_all_spaces(self):
+
+    def _scan_base_dirs(self):
+        """List the sub-directories of the spaces base path in one scandir pass"""
+        with os.scandir(self.spaces_base_path) as it:
+            return [(entry.name, entry.path) for entry in it if entry.is_dir()]
+
+    def find_all_spaces(self, base_dirs=None):
         """Find all potential space directories"""
+        if base_dirs is None:
+            base_dirs = self._scan_base_dirs()
+
         spaces = []
-        
+
         # Look for directories with the required files
-        for item in self.spaces_base_path.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                required_files = ['app.py', 'README.md', 'model_card.md', 'requirements.txt']
-                has_required_files = all((item / file).exists() for file in required_files)
-                
-                if has_required_files:
-                    spaces.append(item.name)
-        
+        for name, path in base_dirs:
+            if not name.startswith('.') and REQUIRED_SPACE_FILES.issubset(os.listdir(path)):
+                spaces.append(name)
+
         return spaces
-    
-    def update_hub_index(self, spaces_list):
-        """Update the main hub README with links to all spaces"""
+
+    def _load_index(self):
+        """Read the hub README, or return None if it does not exist"""
         if not self.index_file.exists():
-            print(f"Hub index file not found: {self.index_file}")
-            return False
-        
-        # Read current content
+            return None
+
         with open(self.index_file, 'r') as f:
-            content = f.read()
-        
-        # Create new spaces section
-        spaces_section = "\n## Available Insurance AI Spaces\n\n"
+            return f.read()
+
+    def _save_index(self, content):
+        """Write the hub README in one go"""
+        with open(self.index_file, 'w') as f:
+            f.write(content)
+
+    @staticmethod
+    def _parse_sections(content):
+        """
+        Split the README into [heading, text] chunks: the prologue before the
+        first H2 (heading None), then one chunk per H2 section
+        """
+        sections = []
+        for chunk in _SECTION_SPLIT_RE.split(content):
+            if chunk.startswith('## '):
+                sections.append([chunk.split('\n', 1)[0], chunk])
+            elif chunk:
+                sections.append([None, chunk])
+        return sections
+
+    @staticmethod
+    def _join_sections(sections):
+        """Re-emit parsed sections as README text"""
+        return "".join(text for _, text in sections)
+
+    @staticmethod
+    def _upsert_section(sections, heading, section, insert_after=()):
+        """
+        Replace the section under `heading`, or insert it after the first
+        existing section in `insert_after` (default: after the prologue)
+        """
+        index = {}
+        for i, (name, _) in enumerate(sections):
+            index.setdefault(name, i)
+
+        if heading in index:
+            sections[index[heading]][1] = section
+            return
+
+        for previous in insert_after:
+            if previous in index:
+                position = index[previous] + 1
+                break
+        else:
+            position = 1 if None in index else 0
+
+        # Keep a blank line between the preceding chunk and the new section
+        if position:
+            before = sections[position - 1]
+            before[1] = before[1].rstrip('\n') + '\n\n'
+
+        sections.insert(position, [heading, section])
+
+    def _apply_spaces(self, sections, spaces_list):
+        """Render the spaces section for spaces_list into the parsed sections"""
+        parts = [f"{SPACES_HEADING}\n\n"]
         for space in sorted(spaces_list):
             # Convert space name to title format
             title = space.replace('-', ' ').title()
-            spaces_section += f"- [{title}](https://huggingface.co/spaces/gcc-insurance-intelligence-lab/{space}) - {title}\n"
-        
-        spaces_section += "\n"
-        
-        # Look for existing spaces section and replace it, or add a new one
-        if "## Available Insurance AI Spaces" in content:
-            # Find and replace the existing section
-            start_idx = content.find("## Available Insurance AI Spaces")
-            end_idx = content.find("\n## ", start_idx + 1)  # Next section
-            if end_idx == -1:
-                end_idx = len(content)  # End of file
-            
-            new_content = content[:start_idx] + spaces_section + content[end_idx:]
-        else:
-            # Add new section after main heading
-            main_heading_end = content.find("\n", content.find("#")) + 1
-            new_content = content[:main_heading_end] + spaces_section + content[main_heading_end:]
-        
-        # Write updated content
-        with open(self.index_file, 'w') as f:
-            f.write(new_content)
-        
+            parts.append(f"- [{title}](https://huggingface.co/spaces/gcc-insurance-intelligence-lab/{space}) - {title}\n")
+        parts.append("\n")
+        spaces_section = "".join(parts)
+
+        self._upsert_section(sections, SPACES_HEADING, spaces_section)
+
+    def _apply_datasets(self, sections, dataset_dirs):
+        """Render the datasets section for dataset_dirs into the parsed sections"""
+        parts = [f"{DATASETS_HEADING}\n\n"]
+        parts.extend(
+            f"- {d.replace('-', ' ').title()} - {d}\n" for d in sorted(dataset_dirs)
+        )
+        parts.append("\n")
+        datasets_section = "".join(parts)
+
+        # Add after spaces section or main content
+        self._upsert_section(
+            sections, DATASETS_HEADING, datasets_section, insert_after=(SPACES_HEADING,)
+        )
+
+    def _apply_models(self, sections, model_dirs):
+        """Render the models section for model_dirs into the parsed sections"""
+        parts = [f"{MODELS_HEADING}\n\n"]
+        parts.extend(
+            f"- {m.replace('-', ' ').replace('_', ' ').title()} - {m}\n"
+            for m in sorted(set(model_dirs))  # Use set to avoid duplicates
+        )
+        parts.append("\n")
+        models_section = "".join(parts)
+
+        # Add after datasets section or other content
+        self._upsert_section(
+            sections, MODELS_HEADING, models_section,
+            insert_after=(DATASETS_HEADING, SPACES_HEADING)
+        )
+
+    def _find_dataset_dirs(self, base_dirs=None):
+        """Look for dataset directories"""
+        if base_dirs is None:
+            base_dirs = self._scan_base_dirs()
+
+        dataset_dirs = []
+        for name, _ in base_dirs:
+            if 'dataset' in name.lower() or 'data' in name.lower():
+                dataset_dirs.append(name)
+        return dataset_dirs
+
+    def _find_model_dirs(self, base_dirs=None):
+        """Look for model directories or model files"""
+        if base_dirs is None:
+            base_dirs = self._scan_base_dirs()
+
+        model_dirs = []
+        for name, _ in base_dirs:
+            if 'model' in name.lower() or 'classifier' in name.lower():
+                model_dirs.append(name)
+
+        # Also look for model files in models directory
+        models_dir = self.spaces_base_path / "models"
+        if models_dir.exists():
+            for model_file in models_dir.glob("*"):
+                if model_file.suffix in ['.pkl', '.joblib', '.bin', '.pt', '.h5', '.onnx', '.model']:
+                    model_dirs.append(model_file.name)
+        return model_dirs
+
+    def update_hub_index(self, spaces_list):
+        """Update the main hub README with links to all spaces"""
+        content = self._load_index()
+        if content is None:
+            print(f"Hub index file not found: {self.index_file}")
+            return False
+
+        sections = self._parse_sections(content)
+        self._apply_spaces(sections, spaces_list)
+        self._save_index(self._join_sections(sections))
+
         print(f"✓ Updated hub index with {len(spaces_list)} spaces")
         return True
-    
+
     def update_hub_with_datasets(self):
         """Update the hub with dataset information"""
-        # Look for dataset directories
-        dataset_dirs = []
-        for item in self.spaces_base_path.iterdir():
-            if item.is_dir() and ('dataset' in item.name.lower() or 'data' in item.name.lower()):
-                dataset_dirs.append(item.name)
-        
+        dataset_dirs = self._find_dataset_dirs()
         if not dataset_dirs:
             return
-        
-        if not self.index_file.exists():
+
+        content = self._load_index()
+        if content is None:
             return
-        
-        # Read current content
-        with open(self.index_file, 'r') as f:
-            content = f.read()
-        
-        # Create datasets section
-        datasets_section = "\n## Available Datasets\n\n"
-        for dataset in sorted(dataset_dirs):
-            title = dataset.replace('-', ' ').title()
-            datasets_section += f"- {title} - {dataset}\n"
-        
-        datasets_section += "\n"
-        
-        # Add or update datasets section
-        if "## Available Datasets" in content:
-            start_idx = content.find("## Available Datasets")
-            end_idx = content.find("\n## ", start_idx + 1)
-            if end_idx == -1:
-                end_idx = len(content)
-            
-            new_content = content[:start_idx] + datasets_section + content[end_idx:]
-        else:
-            # Add after spaces section or main content
-            if "## Available Insurance AI Spaces" in content:
-                spaces_end = content.find("\n## ", content.find("## Available Insurance AI Spaces") + 1)
-                if spaces_end == -1:
-                    spaces_end = len(content)
-                new_content = content[:spaces_end] + datasets_section + content[spaces_end:]
-            else:
-                main_heading_end = content.find("\n", content.find("#")) + 1
-                new_content = content[:main_heading_end] + datasets_section + content[main_heading_end:]
-        
-        # Write updated content
-        with open(self.index_file, 'w') as f:
-            f.write(new_content)
-        
+
+        sections = self._parse_sections(content)
+        self._apply_datasets(sections, dataset_dirs)
+        self._save_index(self._join_sections(sections))
+
         print(f"✓ Updated hub index with {len(dataset_dirs)} datasets")
-    
+
     def update_hub_with_models(self):
         """Update the hub with model information"""
-        # Look for model directories or model files
-        model_dirs = []
-        for item in self.spaces_base_path.iterdir():
-            if item.is_dir() and ('model' in item.name.lower() or 'classifier' in item.name.lower()):
-                model_dirs.append(item.name)
-        
-        # Also look for model files in models directory
-        models_dir = self.spaces_base_path / "models"
-        if models_dir.exists():
-            for model_file in models_dir.glob("*"):
-                if model_file.suffix in ['.pkl', '.joblib', '.bin', '.pt', '.h5', '.onnx', '.model']:
-                    model_dirs.append(model_file.name)
-        
+        model_dirs = self._find_model_dirs()
         if not model_dirs:
             return
-        
-        if not self.index_file.exists():
+
+        content = self._load_index()
+        if content is None:
             return
-        
-        # Read current content
-        with open(self.index_file, 'r') as f:
-            content = f.read()
-        
-        # Create models section
-        models_section = "\n## Available Models\n\n"
-        for model in sorted(set(model_dirs)):  # Use set to avoid duplicates
-            title = model.replace('-', ' ').replace('_', ' ').title()
-            models_section += f"- {title} - {model}\n"
-        
-        models_section += "\n"
-        
-        # Add or update models section
-        if "## Available Models" in content:
-            start_idx = content.find("## Available Models")
-            end_idx = content.find("\n## ", start_idx + 1)
-            if end_idx == -1:
-                end_idx = len(content)
-            
-            new_content = content[:start_idx] + models_section + content[end_idx:]
-        else:
-            # Add after datasets section or other content
-            sections_to_check = ["## Available Datasets", "## Available Insurance AI Spaces"]
-            insert_position = -1
-            
-            for section in sections_to_check:
-                if section in content:
-                    insert_position = content.find(section)
-                    insert_position = content.find("\n## ", insert_position + 1)
-                    if insert_position == -1:
-                        insert_position = len(content)
-                    break
-            
-            if insert_position == -1:
-                # Default to after main heading
-                insert_position = content.find("\n", content.find("#")) + 1
-            
-            if insert_position == 0:
-                insert_position = len(content)
-            
-            new_content = content[:insert_position] + models_section + content[insert_position:]
-        
-        # Write updated content
-        with open(self.index_file, 'w') as f:
-            f.write(new_content)
-        
+
+        sections = self._parse_sections(content)
+        self._apply_models(sections, model_dirs)
+        self._save_index(self._join_sections(sections))
+
         print(f"✓ Updated hub index with {len(model_dirs)} models")
-    
+
     def sync_hub(self):
         """Sync the entire hub with current spaces, datasets, and models"""
         print("🔄 Syncing hub with current assets...")
-        
+
+        # Scan the base directory once and share the listing between finders
+        base_dirs = self._scan_base_dirs()
+
         # Find all spaces
-        spaces = self.find_all_spaces()
+        spaces = self.find_all_spaces(base_dirs)
         print(f"Found {len(spaces)} spaces: {', '.join(spaces)}")
-        
-        # Update hub index
+
+        # Read and parse the index once, apply every section, then write it once
+        content = self._load_index()
+        if content is None:
+            print(f"Hub index file not found: {self.index_file}")
+            return
+        sections = self._parse_sections(content)
+
         if spaces:
-            self.update_hub_index(spaces)
-        
-        # Update with datasets
-        self.update_hub_with_datasets()
-        
-        # Update with models
-        self.update_hub_with_models()
-        
+            self._apply_spaces(sections, spaces)
+            print(f"✓ Updated hub index with {len(spaces)} spaces")
+
+        dataset_dirs = self._find_dataset_dirs(base_dirs)
+        if dataset_dirs:
+            self._apply_datasets(sections, dataset_dirs)
+            print(f"✓ Updated hub index with {len(dataset_dirs)} datasets")
+
+        model_dirs = self._find_model_dirs(base_dirs)
+        if model_dirs:
+            self._apply_models(sections, model_dirs)
+            print(f"✓ Updated hub index with {len(model_dirs)} models")
+
+        self._save_index(self._join_sections(sections))
+
         print("✅ Hub synchronization complete")
 
 
@@ -233,4 +278,4 @@ def run_hub_sync():
 
 
 if __name__ == "__main__":
-    run_hub_sync()
\ No newline at end of file
+    run_hub_sync()
@@ -11,19 +11,37 @@ without manual effort.
 """
 
 import os
+import re
 import sys
-import subprocess
+import asyncio
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 from datetime import datetime
 
-# Import our automation components
-from add_usecase import main as add_usecase_main
-from model_registry_hook import run_model_registry_hook
-from hub_orchestrator import run_hub_sync
+# Import our automation components (the hub sync and model registry hooks,
+# and subprocess, are imported by the commands that use them)
+from add_usecase import create_usecase
 from logging_utility import InsuranceAILogger
 
+# Terms every README and model card must mention, found in one regex pass
+GOVERNANCE_KEYWORDS = ("synthetic", "educational", "human-in-the-loop", "disclaimer")
+# Upper bound on concurrent Hugging Face publishes (keeps clear of rate limits)
+PUBLISH_CONCURRENCY = 8
+
+_GOVERNANCE_RE = re.compile("|".join(map(re.escape, GOVERNANCE_KEYWORDS)), re.IGNORECASE)
+
+
+def _governance_keywords_found(content):
+    """Return the governance keywords present in content (case-insensitive)"""
+    found = set()
+    for match in _GOVERNANCE_RE.finditer(content):
+        found.add(match.group().casefold())
+        if len(found) == len(GOVERNANCE_KEYWORDS):
+            break
+    return found
+
 
 class InsuranceAIPlatformFactory:
     """
@@ -64,38 +82,15 @@ class InsuranceAIPlatformFactory:
         """Generate a new repository using the add-usecase system"""
         print(f"🏗️  Generating repository: {usecase_name}")
         
-        # Prepare arguments for add_usecase
-        args = [usecase_name]
-        if datasets:
-            args.extend(["--datasets"] + datasets)
-        
-        # Call the add-usecase functionality directly
-        import sys
-        original_argv = sys.argv
-        sys.argv = ["add_usecase"] + args
-        
         try:
-            # Import and run the add_usecase main function
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("add_usecase_module", "add_usecase.py")
-            add_usecase_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(add_usecase_module)
-            
-            # Create argument namespace
-            from argparse import Namespace
-            args_namespace = Namespace(name=usecase_name, datasets=datasets)
-            
-            # Run the creation process
-            add_usecase_module.usecase_name = usecase_name
-            add_usecase_module.main = lambda: None  # Override main to avoid arg parsing
-            
-            # Actually create the files
             usecase_dir = Path(usecase_name)
             if usecase_dir.exists():
                 print(f"⚠️  Directory {usecase_name} already exists, skipping creation")
             else:
-                # Execute the creation process
-                os.system(f"python add_usecase.py {usecase_name} {' '.join(['--datasets'] + datasets) if datasets else ''}")
+                # Create the files in-process (no interpreter per use case)
+                if not create_usecase(usecase_name, datasets=datasets):
+                    print(f"❌ Error generating repository: {usecase_name} was not created")
+                    return False
                 
             print(f"✅ Repository {usecase_name} generated")
             return True
@@ -103,25 +98,24 @@ class InsuranceAIPlatformFactory:
         except Exception as e:
             print(f"❌ Error generating repository: {e}")
             return False
-        finally:
-            sys.argv = original_argv
     
     def validate_repository(self, repo_path):
         """Validate a repository meets all requirements"""
         print(f"🔍 Validating repository: {repo_path}")
         
         repo_path = Path(repo_path)
-        if not repo_path.exists():
+        
+        # One directory listing answers every file check below
+        try:
+            with os.scandir(repo_path) as it:
+                present = {entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
             print(f"❌ Repository {repo_path} does not exist")
             return False
         
         # Check required files
         required_files = ["app.py", "requirements.txt", "README.md", "model_card.md"]
-        missing_files = []
-        
-        for file in required_files:
-            if not (repo_path / file).exists():
-                missing_files.append(file)
+        missing_files = [file for file in required_files if file not in present]
         
         if missing_files:
             print(f"❌ Missing required files: {missing_files}")
@@ -129,8 +123,9 @@ class InsuranceAIPlatformFactory:
         
         # Run smoke tests if they exist
         test_file = repo_path / "test_smoke.py"
-        if test_file.exists():
+        if test_file.name in present:
             print("🧪 Running smoke tests...")
+            import subprocess
             result = subprocess.run([
                 sys.executable, str(test_file)
             ], cwd=repo_path, capture_output=True, text=True)
@@ -141,18 +136,18 @@ class InsuranceAIPlatformFactory:
             else:
                 print("✅ Smoke tests passed")
         
-        # Check governance requirements
+        # Check governance requirements: each document is read once and scanned
+        # once case-insensitively, with no lowercased copies
         readme_content = (repo_path / "README.md").read_text()
         model_card_content = (repo_path / "model_card.md").read_text()
         
-        governance_keywords = [
-            "synthetic", "educational", "human-in-the-loop", "disclaimer"
-        ]
+        readme_found = _governance_keywords_found(readme_content)
+        model_card_found = _governance_keywords_found(model_card_content)
         
-        for keyword in governance_keywords:
-            if keyword.lower() not in readme_content.lower():
+        for keyword in GOVERNANCE_KEYWORDS:
+            if keyword not in readme_found:
                 print(f"⚠️  Governance keyword '{keyword}' not found in README")
-            if keyword.lower() not in model_card_content.lower():
+            if keyword not in model_card_found:
                 print(f"⚠️  Governance keyword '{keyword}' not found in model_card")
         
         print(f"✅ Repository {repo_path} validated")
@@ -179,6 +174,16 @@ class InsuranceAIPlatformFactory:
             return False
         
         try:
+            # Upload the present files in one commit (a single create_commit
+            # request instead of one upload_file round-trip per file)
+            files_to_upload = [
+                file for file in ["app.py", "requirements.txt", "README.md", "model_card.md"]
+                if (repo_path / file).exists()
+            ]
+            if not files_to_upload:
+                print(f"⚠️  No files to upload in {repo_path}, skipping publication")
+                return False
+            
             api = HfApi()
             
             # Create/update space
@@ -193,19 +198,15 @@ class InsuranceAIPlatformFactory:
                 private=False
             )
             
-            # Upload files
-            files_to_upload = ["app.py", "requirements.txt", "README.md", "model_card.md"]
-            
+            api.upload_folder(
+                folder_path=str(repo_path),
+                repo_id=repo_id,
+                repo_type='space',
+                allow_patterns=files_to_upload,
+                commit_message=f"Publish {repo_name}"
+            )
             for file in files_to_upload:
-                file_path = repo_path / file
-                if file_path.exists():
-                    api.upload_file(
-                        path_or_fileobj=str(file_path),
-                        path_in_repo=file,
-                        repo_id=repo_id,
-                        repo_type='space'
-                    )
-                    print(f"✓ Uploaded {file}")
+                print(f"✓ Uploaded {file}")
             
             print(f"✅ Published to https://huggingface.co/spaces/{repo_id}")
             return True
@@ -214,12 +215,33 @@ class InsuranceAIPlatformFactory:
             print(f"❌ Error publishing to Hugging Face: {e}")
             return False
     
+    async def _publish_to_hf_async(self, repo_path, hf_token, semaphore):
+        """Run one blocking publish_to_hf in a worker thread, within the semaphore"""
+        async with semaphore:
+            return await asyncio.to_thread(self.publish_to_hf, repo_path, hf_token)
+    
+    def publish_many_to_hf(self, repo_paths, hf_token=None):
+        """Publish several repositories with overlapping uploads; one result per path"""
+        async def publish_all():
+            # Size the to_thread pool to the limit (the default scales with CPUs)
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=PUBLISH_CONCURRENCY)
+            )
+            semaphore = asyncio.Semaphore(PUBLISH_CONCURRENCY)
+            return await asyncio.gather(*(
+                self._publish_to_hf_async(repo_path, hf_token, semaphore)
+                for repo_path in repo_paths
+            ))
+        
+        return list(asyncio.run(publish_all()))
+    
     def link_to_hub(self, repo_name):
         """Link the new repository to the main hub"""
         print(f"🔗 Linking {repo_name} to main hub...")
         
         try:
             # Run the hub orchestrator to update the main index
+            from hub_orchestrator import run_hub_sync
             run_hub_sync()
             print(f"✅ {repo_name} linked to hub")
             return True
@@ -268,6 +290,11 @@ def main():
     add_parser.add_argument('--datasets', nargs='*', help='Optional synthetic datasets to create')
     add_parser.add_argument('--token', help='Hugging Face token for publication')
     
+    # Publish command
+    pub_parser = subparsers.add_parser('publish', help='Publish existing use cases to Hugging Face')
+    pub_parser.add_argument('names', nargs='+', help='Use case directories to publish')
+    pub_parser.add_argument('--token', help='Hugging Face token for publication')
+    
     # Initialize factory command
     init_parser = subparsers.add_parser('init', help='Initialize the factory')
     
@@ -300,10 +327,17 @@ def main():
             print(f"\n❌ Failed to create use case '{args.name}'")
             sys.exit(1)
             
+    elif args.command == 'publish':
+        results = factory.publish_many_to_hf(args.names, hf_token=args.token)
+        if not all(results):
+            sys.exit(1)
+            
     elif args.command == 'sync-hub':
+        from hub_orchestrator import run_hub_sync
         run_hub_sync()
         
     elif args.command == 'register-models':
+        from model_registry_hook import run_model_registry_hook
         run_model_registry_hook()
         
     else:
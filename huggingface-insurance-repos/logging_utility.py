@@ -5,10 +5,90 @@ Provides consistent logging across all apps with invocation tracking
 
 import os
 import json
+import mmap
+import struct
 import time
+import atexit
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+try:
+    import zstandard
+    USE_ZSTD = True
+except ImportError:
+    USE_ZSTD = False
+
+# Background flush tuning: entries are written at least every FLUSH_INTERVAL
+# seconds, sooner once FLUSH_BATCH_SIZE are queued; the counter's JSON sidecar
+# is rewritten every COUNTER_FLUSH_EVERY invocations (and on every flush)
+FLUSH_INTERVAL = 0.5
+FLUSH_BATCH_SIZE = 64
+COUNTER_FLUSH_EVERY = 100
+
+# A JSONL log is rotated once it reaches ROTATE_BYTES; the rotated segment is
+# zstd-compressed in the background when zstandard is installed
+ROTATE_BYTES = 10 * 1024 * 1024
+ZSTD_LEVEL = 3
+
+# Binary counter layout: invocation count, last update (epoch ns)
+_COUNTER_STRUCT = struct.Struct('<QQ')
+
+# JSONL file suffix per log type
+_LOG_SUFFIXES = {
+    "invocation": "invocations",
+    "error": "errors",
+    "warning": "warnings",
+}
+
+def _dumps_line(entry):
+    """Serialize a log entry as one JSONL line (bytes); unsupported values are logged via str()"""
+    if USE_ORJSON:
+        return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+    return (json.dumps(entry, default=str) + '\n').encode('utf-8')
+
+# os.writev accepts at most IOV_MAX buffers per call
+_IOV_MAX = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') else 1024
+
+def _append_lines(path, lines):
+    """
+    Append encoded lines to path and return the new file size. On POSIX this
+    is one scatter write (os.writev) per IOV_MAX lines; elsewhere writelines
+    """
+    if not hasattr(os, 'writev'):
+        with open(path, 'ab') as f:
+            f.writelines(lines)
+            return f.tell()
+    
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        for start in range(0, len(lines), _IOV_MAX):
+            group = lines[start:start + _IOV_MAX]
+            written = os.writev(fd, group)
+            if written < sum(len(line) for line in group):
+                # Short write: finish the remainder with plain writes
+                data = memoryview(b"".join(group))[written:]
+                while data:
+                    data = data[os.write(fd, data):]
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+def _compress_segment(path):
+    """Compress a rotated log segment to <path>.zst and remove the original"""
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    with open(path, 'rb') as src, open(f"{path}.zst", 'wb') as dst:
+        compressor.copy_stream(src, dst)
+    os.remove(path)
+
 class InsuranceAILogger:
     """
     A simple logger utility for tracking invocations and errors in insurance AI apps.
@@ -22,44 +102,140 @@ class InsuranceAILogger:
         
         # Initialize invocation counter
         self.counter_file = self.log_dir / f"{app_name}_counter.json"
+        self.counter_bin = self.log_dir / f"{app_name}_counter.bin"
+        self._lock = threading.Lock()
         self._init_counter()
+        
+        # Entries are queued here and written in batches by a background thread
+        self._queue = deque()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._log_files = {
+            log_type: self.log_dir / f"{app_name}_{suffix}.jsonl"
+            for log_type, suffix in _LOG_SUFFIXES.items()
+        }
+        self._compressor = None  # single-worker pool, created on first rotation
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name=f"{app_name}-log-flush", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.flush)
     
     def _init_counter(self):
-        """Initialize the invocation counter"""
-        if not self.counter_file.exists():
-            with open(self.counter_file, 'w') as f:
-                json.dump({"count": 0, "last_updated": datetime.now().isoformat()}, f)
+        """
+        Map the binary invocation counter into memory.
+
+        The counter lives in {app}_counter.bin as two little-endian uint64s
+        (count, last update in epoch ns); {app}_counter.json is a readable
+        sidecar rewritten by the flusher, and seeds a new .bin file.
+        """
+        fd = os.open(self.counter_bin, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            is_new = os.fstat(fd).st_size < _COUNTER_STRUCT.size
+            if is_new:
+                os.ftruncate(fd, _COUNTER_STRUCT.size)
+            self._counter_mm = mmap.mmap(fd, _COUNTER_STRUCT.size)
+        finally:
+            os.close(fd)
+        
+        if is_new:
+            count = 0
+            if self.counter_file.exists():
+                with open(self.counter_file, 'r') as f:
+                    count = json.load(f).get("count", 0)
+            _COUNTER_STRUCT.pack_into(self._counter_mm, 0, count, time.time_ns())
+        self._count_unsaved = 1 if is_new else 0
     
     def get_invocation_count(self):
         """Get the current invocation count"""
-        if self.counter_file.exists():
-            with open(self.counter_file, 'r') as f:
-                data = json.load(f)
-                return data.get("count", 0)
-        return 0
-    
-    def increment_invocation(self):
-        """Increment the invocation counter"""
-        if self.counter_file.exists():
-            with open(self.counter_file, 'r') as f:
-                data = json.load(f)
-        else:
-            data = {"count": 0}
+        return _COUNTER_STRUCT.unpack_from(self._counter_mm, 0)[0]
+    
+    def increment_invocation(self, n=1):
+        """Increment the invocation counter (by n for a batch of requests)"""
+        with self._lock:
+            count = _COUNTER_STRUCT.unpack_from(self._counter_mm, 0)[0] + n
+            _COUNTER_STRUCT.pack_into(self._counter_mm, 0, count, time.time_ns())
+            self._count_unsaved += 1
         
-        data["count"] += 1
-        data["last_updated"] = datetime.now().isoformat()
+        if self._count_unsaved >= COUNTER_FLUSH_EVERY:
+            self._wake.set()
         
+        return count
+    
+    def _save_counter(self):
+        """Rewrite the readable JSON sidecar from the binary counter"""
+        with self._lock:
+            if not self._count_unsaved:
+                return
+            count, updated_ns = _COUNTER_STRUCT.unpack_from(self._counter_mm, 0)
+            self._count_unsaved = 0
+        
+        data = {
+            "count": count,
+            "last_updated": datetime.fromtimestamp(updated_ns / 1e9).isoformat()
+        }
         with open(self.counter_file, 'w') as f:
             json.dump(data, f)
+    
+    # (epoch second, ISO string) of the last timestamp formatted
+    _ts_cache = (0, "")
+    
+    @classmethod
+    def _now_iso(cls):
+        """Current time as an ISO string at second resolution, formatted once per second"""
+        now = int(time.time())
+        cached = cls._ts_cache
+        if cached[0] != now:
+            cached = (now, datetime.fromtimestamp(now).isoformat())
+            cls._ts_cache = cached
+        return cached[1]
+    
+    def _enqueue(self, log_entry):
+        """Serialize an entry on the calling thread and queue the line"""
+        self._queue.append((log_entry["log_type"], _dumps_line(log_entry)))
+        if len(self._queue) >= FLUSH_BATCH_SIZE:
+            self._wake.set()
+    
+    def _flush_loop(self):
+        """Background thread: flush queued entries periodically or when woken"""
+        while True:
+            self._wake.wait(FLUSH_INTERVAL)
+            self._wake.clear()
+            self.flush()
+    
+    def flush(self):
+        """Write all queued entries (one append per log file) and the counter"""
+        with self._flush_lock:
+            batches = {}
+            while self._queue:
+                log_type, line = self._queue.popleft()
+                batches.setdefault(log_type, []).append(line)
+            
+            for log_type, lines in batches.items():
+                path = self._log_files[log_type]
+                if _append_lines(path, lines) >= ROTATE_BYTES:
+                    self._rotate(path)
+            
+            self._save_counter()
+    
+    def _rotate(self, path):
+        """Move a full log aside (new entries start a fresh file) and compress it"""
+        segment = f"{path}.{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        os.replace(path, segment)
         
-        return data["count"]
+        if USE_ZSTD:
+            if self._compressor is None:
+                self._compressor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"{self.app_name}-log-zstd"
+                )
+            self._compressor.submit(_compress_segment, segment)
     
-    def log_invocation(self, inputs, outputs, user_id=None, session_id=None):
-        """Log an invocation with inputs and outputs"""
-        invocation_count = self.increment_invocation()
+    def log_invocation(self, inputs, outputs, user_id=None, session_id=None, batch_size=None):
+        """Log an invocation with inputs and outputs (one entry per batch when batch_size is set)"""
+        invocation_count = self.increment_invocation(batch_size or 1)
         
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_iso(),
             "invocation_number": invocation_count,
             "app_name": self.app_name,
             "inputs": inputs,
@@ -68,18 +244,18 @@ class InsuranceAILogger:
             "session_id": session_id,
             "log_type": "invocation"
         }
+        if batch_size is not None:
+            log_entry["batch_size"] = batch_size
         
-        # Write to invocation log
-        log_file = self.log_dir / f"{self.app_name}_invocations.jsonl"
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        # Queue for the invocation log
+        self._enqueue(log_entry)
         
         return invocation_count
     
     def log_error(self, error_msg, inputs=None, user_id=None, session_id=None):
         """Log an error"""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_iso(),
             "app_name": self.app_name,
             "error": str(error_msg),
             "inputs": inputs,
@@ -88,15 +264,13 @@ class InsuranceAILogger:
             "log_type": "error"
         }
         
-        # Write to error log
-        log_file = self.log_dir / f"{self.app_name}_errors.jsonl"
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        # Queue for the error log
+        self._enqueue(log_entry)
     
     def log_warning(self, warning_msg, inputs=None, user_id=None, session_id=None):
         """Log a warning"""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_iso(),
             "app_name": self.app_name,
             "warning": str(warning_msg),
             "inputs": inputs,
@@ -105,16 +279,17 @@ class InsuranceAILogger:
             "log_type": "warning"
         }
         
-        # Write to warning log
-        log_file = self.log_dir / f"{self.app_name}_warnings.jsonl"
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        # Queue for the warning log
+        self._enqueue(log_entry)
 
 # Example usage function
-def add_logging_to_gradio_app(app, logger):
+def add_logging_to_gradio_app(app, logger, batch=False):
     """
     Utility function to add logging to a Gradio app
     This is a decorator-style function to wrap Gradio interfaces
+
+    With batch=True the wrapped function is a Gradio batch handler (one list
+    per input); each batch is logged as a single entry with its batch_size.
     """
     def logged_function(*args, **kwargs):
         try:
@@ -124,7 +299,8 @@ def add_logging_to_gradio_app(app, logger):
             outputs = {"result": result}
             
             # Log successful invocation
-            invocation_count = logger.log_invocation(inputs, outputs)
+            batch_size = len(args[0]) if batch and args else None
+            invocation_count = logger.log_invocation(inputs, outputs, batch_size=batch_size)
             
             return result
         except Exception as e:
@@ -4,40 +4,60 @@ Automatically detects trained models in /models folder and pushes them to HF Mod
 """
 
 import os
+import sys
 import json
 from pathlib import Path
-import tempfile
 from datetime import datetime
 
-class ModelRegistryHook:
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+# Extensions (without the dot, lowercase) treated as trained model files
+MODEL_EXTENSIONS = frozenset({'pkl', 'joblib', 'bin', 'pt', 'h5', 'onnx', 'model'})
+
+# Directory names never descended into when scanning for models
+_SKIP_DIRS = frozenset({'.git', '__pycache__', 'node_modules', '.venv', 'venv', '.mypy_cache', '.pytest_cache'})
+
+# Summary of every registered model's metadata file, kept in the models folder
+INDEX_FILENAME = "_index.json"
+
+def _scandir_iter(root):
     """
-    Auto-detects trained models in /models folder and pushes them to HF Model Hub
+    Walk root with os.scandir, yielding (dir_path, names, file_entries) per
+    directory: names is the set of every entry name in it, file_entries the
+    DirEntry of each regular file. Directories are taken from an explicit
+    stack (no recursion, so no depth limit). Type checks use the info cached
+    by scandir (no per-file stat); symlinks and _SKIP_DIRS are not followed
+    and unreadable or vanished directories are skipped. Callers that need size
+    or mtime should use entry.stat(follow_symlinks=False), which is cached on
+    the DirEntry, rather than stat() on a Path built from entry.path.
     """
-    
-    def __init__(self, models_dir="models", hf_org="gcc-insurance-intelligence-lab"):
-        self.models_dir = Path(models_dir)
-        self.hf_org = hf_org
-        self.models_dir.mkdir(exist_ok=True)
-    
-    def scan_for_new_models(self):
-        """Scan for new model files that need to be registered"""
-        model_extensions = ['.pkl', '.joblib', '.bin', '.pt', '.h5', '.onnx', '.model']
-        new_models = []
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        names = set()
+        file_entries = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    names.add(entry.name)
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        file_entries.append(entry)
+        except (FileNotFoundError, PermissionError):
+            continue
         
-        for file_path in self.models_dir.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in model_extensions:
-                # Check if model is already registered
-                model_name = file_path.stem
-                metadata_file = file_path.with_name(f"{model_name}_metadata.json")
-                
-                if not metadata_file.exists():
-                    new_models.append(file_path)
-        
-        return new_models
-    
-    def create_model_card(self, model_path, model_name):
-        """Create a model card for the given model"""
-        model_card_content = f"""# Model Card: {model_name}
+        yield path, names, file_entries
+
+# Built-in model card, filled in with str.format_map ({model_name}, {model_type}, {date})
+_DEFAULT_MODEL_CARD_TEMPLATE = """# Model Card: {model_name}
 
 ## Model Details
 
@@ -46,7 +66,7 @@ class ModelRegistryHook:
 Insurance risk assessment model trained on synthetic data for educational purposes only. This model is not intended for production use.
 
 - **Developed by:** GCC Insurance Intelligence Lab
-- **Model Type:** {model_path.suffix.upper()[1:]} model
+- **Model Type:** {model_type} model
 - **Version:** 1.0
 - **Framework:** Trained with synthetic data
 - **License:** MIT (Educational Use Only)
@@ -171,23 +191,89 @@ For questions or feedback about this educational tool, contact the GCC Insurance
 ---
 
 **Version**: 1.0  
-**Last Updated**: {datetime.now().strftime('%B %Y')}  
+**Last Updated**: {date}  
 **Status**: Educational Demonstration
 """
-        return model_card_content
+
+# A model_card.tmpl next to this module overrides the built-in card; it is
+# read once at import, not per model
+_TEMPLATE_PATH = Path(__file__).with_name("model_card.tmpl")
+_MODEL_CARD_TEMPLATE = (
+    _TEMPLATE_PATH.read_text(encoding='utf-8') if _TEMPLATE_PATH.exists()
+    else _DEFAULT_MODEL_CARD_TEMPLATE
+)
+
+# Shared fallback encoder: json.dumps(..., indent=2) builds a new one per call
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+def _dumps_metadata(metadata):
+    """Serialize registration metadata as indented JSON bytes"""
+    if USE_ORJSON:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    return _JSON_ENCODER.encode(metadata).encode('utf-8')
+
+class ModelRegistryHook:
+    """
+    Auto-detects trained models in /models folder and pushes them to HF Model Hub
+    """
+    
+    def __init__(self, models_dir="models", hf_org="gcc-insurance-intelligence-lab"):
+        self.models_dir = Path(models_dir)
+        self.hf_org = hf_org
+        self.models_dir.mkdir(exist_ok=True)
+        # Messages collected during process_all_new_models (None: print directly)
+        self._log = None
+    
+    def _say(self, message):
+        """Print a message, or buffer it while a bulk run is in progress"""
+        if self._log is None:
+            print(message)
+        else:
+            self._log.append(message)
+    
+    def scan_for_new_models(self):
+        """Scan for new model files that need to be registered"""
+        new_models = []
+        
+        for dir_path, names, file_entries in _scandir_iter(self.models_dir):
+            for entry in file_entries:
+                # Filter on the name string; most files are not models, so no
+                # Path is built and lower() only runs for non-lowercase suffixes
+                name = entry.name
+                dot = name.rfind('.')
+                if dot <= 0:
+                    continue
+                ext = name[dot + 1:]
+                if ext not in MODEL_EXTENSIONS and ext.lower() not in MODEL_EXTENSIONS:
+                    continue
+                
+                # Already registered if its metadata sits in the same directory
+                if f"{name[:dot]}_metadata.json" not in names:
+                    new_models.append(Path(entry.path))
+        
+        return new_models
     
-    def register_model(self, model_path):
+    def create_model_card(self, model_path, model_name, card_date=None):
+        """Create a model card for the given model (card_date defaults to this month)"""
+        return _MODEL_CARD_TEMPLATE.format_map({
+            "model_name": model_name,
+            "model_type": model_path.suffix.upper()[1:],
+            "date": card_date or datetime.now().strftime('%B %Y'),
+        })
+    
+    def register_model(self, model_path, card_date=None):
         """Register a model to Hugging Face Hub"""
         model_name = model_path.stem
-        print(f"Registering model: {model_name}")
+        self._say(f"Registering model: {model_name}")
         
-        # Create model card if it doesn't exist
+        # Create model card if it doesn't exist ('x' mode: no separate exists() check)
         model_card_path = model_path.with_name(f"{model_name}_card.md")
-        if not model_card_path.exists():
-            model_card_content = self.create_model_card(model_path, model_name)
-            with open(model_card_path, 'w') as f:
-                f.write(model_card_content)
-            print(f"✓ Created model card: {model_card_path.name}")
+        try:
+            with open(model_card_path, 'x', encoding='utf-8') as f:
+                f.write(self.create_model_card(model_path, model_name, card_date))
+            self._say(f"✓ Created model card: {model_card_path.name}")
+        except FileExistsError:
+            pass
         
         # Create metadata to track registration
         metadata = {
@@ -199,15 +285,14 @@ For questions or feedback about this educational tool, contact the GCC Insurance
         }
         
         metadata_file = model_path.with_name(f"{model_name}_metadata.json")
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_file.write_bytes(_dumps_metadata(metadata))
         
-        print(f"✓ Created metadata: {metadata_file.name}")
+        self._say(f"✓ Created metadata: {metadata_file.name}")
         
         # Note: Actual upload to HF Hub requires authentication
         # This would be handled by the CI/CD system
-        print(f"ℹ️  Model {model_name} prepared for upload to {self.hf_org}/{model_name}")
-        print(f"ℹ️  Upload requires HF credentials and would be handled by CI/CD")
+        self._say(f"ℹ️  Model {model_name} prepared for upload to {self.hf_org}/{model_name}")
+        self._say(f"ℹ️  Upload requires HF credentials and would be handled by CI/CD")
         
         return str(metadata_file)
     
@@ -219,15 +304,48 @@ For questions or feedback about this educational tool, contact the GCC Insurance
             print("No new models found to register")
             return []
         
+        # Every card in this run carries the same date, so format it once
+        card_date = datetime.now().strftime('%B %Y')
         registered_models = []
-        for model_path in new_models:
-            try:
-                metadata_file = self.register_model(model_path)
-                registered_models.append(metadata_file)
-            except Exception as e:
-                print(f"❌ Error registering {model_path.name}: {e}")
+        # Buffer the per-model messages and write them out in one go
+        self._log = []
+        try:
+            for model_path in new_models:
+                try:
+                    metadata_file = self.register_model(model_path, card_date)
+                    registered_models.append(metadata_file)
+                except Exception as e:
+                    self._say(f"❌ Error registering {model_path.name}: {e}")
+        finally:
+            log, self._log = self._log, None
+            if log:
+                sys.stdout.write("\n".join(log) + "\n")
+                sys.stdout.flush()
+        
+        if registered_models:
+            self.update_index(registered_models)
         
         return registered_models
+    
+    def update_index(self, metadata_files):
+        """
+        Add metadata files to models/_index.json, the list of registered
+        models, in one write at the end of a run rather than one per model
+        """
+        index_file = self.models_dir / INDEX_FILENAME
+        try:
+            registered = set(json.loads(index_file.read_bytes())["models"])
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            registered = set()
+        
+        registered.update(
+            os.path.relpath(metadata_file, self.models_dir) for metadata_file in metadata_files
+        )
+        index = {
+            "updated_at": datetime.now().isoformat(),
+            "models": sorted(registered),
+        }
+        index_file.write_bytes(_dumps_metadata(index))
 
 # Example usage
 def run_model_registry_hook():
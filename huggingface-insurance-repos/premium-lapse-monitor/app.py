@@ -7,19 +7,26 @@ Part of gcc-insurance-intelligence-lab
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
 from datetime import datetime
 import sys
 from pathlib import Path
 
-# Add logging
-sys.path.append(str(Path(__file__).parent.parent / "automation" / "scripts"))
-try:
-    from logger_utility import AppLogger
-    logger = AppLogger("premium-lapse-monitor")
-except ImportError:
-    logger = None
+# Add logging (Streamlit reruns this script on every interaction, so the
+# path is added once and the logger is built once per process)
+_SCRIPTS_DIR = str(Path(__file__).parent.parent / "automation" / "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.append(_SCRIPTS_DIR)
+
+@st.cache_resource(show_spinner=False)
+def _get_logger():
+    try:
+        from logger_utility import AppLogger
+    except ImportError:
+        return None
+    return AppLogger("premium-lapse-monitor")
+
+# Rows parsed from an uploaded CSV for the preview
+PREVIEW_ROWS = 100
 
 # Page config
 st.set_page_config(
@@ -28,6 +35,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Built after set_page_config, which must be the first Streamlit command
+logger = _get_logger()
+
 # Header
 st.title("🏢 Premium Lapse Monitor")
 st.markdown("Premium Lapse Monitor")
@@ -60,7 +70,10 @@ with tab1:
     uploaded_file = st.file_uploader("Upload CSV (Synthetic Data Only)", type=["csv"])
     
     if uploaded_file:
-        df = pd.read_csv(uploaded_file)
+        # pandas is only needed once a file is uploaded, so import it here
+        import pandas as pd
+        # Parse only the rows the preview needs
+        df = pd.read_csv(uploaded_file, nrows=PREVIEW_ROWS)
         st.dataframe(df.head())
         
         if logger:
@@ -1,80 +1,47 @@
 import gradio as gr
 import json
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
 
-def mock_reinsurance_pricing(risk_group, frequency_tier, loss_severity):
-    """
-    Mock reinsurance pricing based on risk factors
-    
-    Args:
-        risk_group: Risk category
-        frequency_tier: Claim frequency (1-5)
-        loss_severity: Severity category
-    
-    Returns:
-        Indicative category, appetite indicator, capital pressure note
-    """
-    
-    # Risk group multipliers
-    risk_multipliers = {
-        'Agricultural': 1.2,
-        'Construction': 1.4,
-        'Energy': 1.3,
-        'Healthcare': 1.1,
-        'Manufacturing': 1.3,
-        'Technology': 0.9,
-        'Transportation': 1.2
-    }
-    
-    # Frequency multipliers
-    freq_multipliers = {
-        1: 0.8,  # Low frequency
-        2: 0.9,  # Low-Med
-        3: 1.0,  # Medium
-        4: 1.2,  # Med-High
-        5: 1.5   # High
-    }
-    
-    # Severity multipliers
-    severity_multipliers = {
-        'Low': 0.8,
-        'Medium': 1.0,
-        'High': 1.4
-    }
-    
-    # Calculate composite risk score
-    risk_multiplier = risk_multipliers.get(risk_group, 1.0)
-    freq_multiplier = freq_multipliers.get(frequency_tier, 1.0)
-    severity_multiplier = severity_multipliers.get(loss_severity, 1.0)
-    
-    composite_score = risk_multiplier * freq_multiplier * severity_multiplier
-    
-    # Determine indicative category
-    if composite_score < 1.0:
-        category = "A"
-        appetite = "Strong"
-        pressure = "Low"
-        color = "🟢"
-    elif composite_score < 1.3:
-        category = "B"
-        appetite = "Moderate"
-        pressure = "Moderate"
-        color = "🟡"
-    else:
-        category = "C"
-        appetite = "Cautious"
-        pressure = "High"
-        color = "🔴"
-    
-    # Capital pressure note
-    if pressure == "High":
-        pressure_note = "⚠️ Significant capital stress anticipated. Consider capacity limitations."
-    elif pressure == "Moderate":
-        pressure_note = "⚖️ Moderate capital impact. Monitor exposure concentrations."
-    else:
-        pressure_note = "✅ Minimal capital impact expected."
-    
-    # Build detailed explanation
-    explanation = f"""# {color} Reinsurance Pricing Mock Analysis
+# Risk group multipliers
+RISK_MULTIPLIERS = MappingProxyType({
+    'Agricultural': 1.2,
+    'Construction': 1.4,
+    'Energy': 1.3,
+    'Healthcare': 1.1,
+    'Manufacturing': 1.3,
+    'Technology': 0.9,
+    'Transportation': 1.2
+})
+
+# Frequency multipliers
+FREQ_MULTIPLIERS = MappingProxyType({
+    1: 0.8,  # Low frequency
+    2: 0.9,  # Low-Med
+    3: 1.0,  # Medium
+    4: 1.2,  # Med-High
+    5: 1.5   # High
+})
+
+# Severity multipliers
+SEVERITY_MULTIPLIERS = MappingProxyType({
+    'Low': 0.8,
+    'Medium': 1.0,
+    'High': 1.4
+})
+
+# Composite score bands: A below 1.0, B from 1.0 to below 1.3, C from 1.3
+CATEGORY_THRESHOLDS = (1.0, 1.3)
+# (category, appetite, capital pressure, color, pressure note) per band
+CATEGORIES = (
+    ("A", "Strong", "Low", "🟢", "✅ Minimal capital impact expected."),
+    ("B", "Moderate", "Moderate", "🟡", "⚖️ Moderate capital impact. Monitor exposure concentrations."),
+    ("C", "Cautious", "High", "🔴", "⚠️ Significant capital stress anticipated. Consider capacity limitations."),
+)
+
+# Detailed analysis and quick summary, filled in with str.format_map per request
+EXPLANATION_TEMPLATE = """# {color} Reinsurance Pricing Mock Analysis
 
 ## Indicative Category: {category}
 
@@ -133,9 +100,8 @@ This tool demonstrates fictional reinsurance concepts using synthetic logic. No
 
 **No actual premiums or financial obligations are calculated.**
 """
-    
-    # Summary
-    summary = f"""**Indicative Category:** {color} {category}
+
+SUMMARY_TEMPLATE = """**Indicative Category:** {color} {category}
 **Reinsurance Appetite:** {appetite}
 **Capital Pressure:** {pressure}
 **Composite Score:** {composite_score:.2f}
@@ -144,6 +110,58 @@ This tool demonstrates fictional reinsurance concepts using synthetic logic. No
 - Risk Group: {risk_multiplier:.2f}
 - Frequency: {freq_multiplier:.2f}
 - Severity: {severity_multiplier:.2f}"""
+
+def mock_reinsurance_pricing(risk_group, frequency_tier, loss_severity):
+    """
+    Mock reinsurance pricing based on risk factors
+    
+    Args:
+        risk_group: Risk category
+        frequency_tier: Claim frequency (1-5)
+        loss_severity: Severity category
+    
+    Returns:
+        Indicative category, appetite indicator, capital pressure note
+    """
+    # lru_cache treats 3 and 3.0 as one key, so normalise whole-number tiers
+    # to int before the cached call; the explanation then always reads "3/5"
+    if isinstance(frequency_tier, float) and frequency_tier.is_integer():
+        frequency_tier = int(frequency_tier)
+    return _compute(risk_group, frequency_tier, loss_severity)
+
+# Only 7 x 5 x 3 input combinations exist, so every result is cached
+@lru_cache(maxsize=256)
+def _compute(risk_group, frequency_tier, loss_severity):
+    """Build (explanation, summary, composite_score, appetite) for one input combination"""
+    # Calculate composite risk score
+    risk_multiplier = RISK_MULTIPLIERS.get(risk_group, 1.0)
+    freq_multiplier = FREQ_MULTIPLIERS.get(frequency_tier, 1.0)
+    severity_multiplier = SEVERITY_MULTIPLIERS.get(loss_severity, 1.0)
+    
+    composite_score = risk_multiplier * freq_multiplier * severity_multiplier
+    
+    # Determine indicative category, appetite, pressure and note in one lookup
+    category, appetite, pressure, color, pressure_note = CATEGORIES[
+        bisect_right(CATEGORY_THRESHOLDS, composite_score)
+    ]
+    
+    # Build detailed explanation and summary
+    fields = {
+        "color": color,
+        "category": category,
+        "appetite": appetite,
+        "pressure": pressure,
+        "pressure_note": pressure_note,
+        "composite_score": composite_score,
+        "risk_group": risk_group,
+        "frequency_tier": frequency_tier,
+        "loss_severity": loss_severity,
+        "risk_multiplier": risk_multiplier,
+        "freq_multiplier": freq_multiplier,
+        "severity_multiplier": severity_multiplier,
+    }
+    explanation = EXPLANATION_TEMPLATE.format_map(fields)
+    summary = SUMMARY_TEMPLATE.format_map(fields)
     
     return explanation, summary, composite_score, appetite
 
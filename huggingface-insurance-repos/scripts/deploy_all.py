@@ -5,10 +5,50 @@ This script deploys all agent repositories to Hugging Face Spaces
 """
 
 import os
-import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Upper bound on deploy scripts running at once (each is network-bound)
+DEPLOY_CONCURRENCY = 8
+
+# Lines of deploy output kept per agent for the failure report
+TAIL_LINES = 200
+
+# Keeps live output lines from concurrent deploys from interleaving
+_print_lock = threading.Lock()
+
+# Files a directory must contain to be deployed as an agent repo
+_REQUIRED = frozenset({"app.py", "requirements.txt", "README.md", "model_card.md", "deploy_to_hf.py"})
+
+def _deploy_one(agent_dir):
+    """
+    Run one agent's deploy script, echoing its output live with the agent name
+    as prefix; returns (name, returncode, tail) where tail is the last
+    TAIL_LINES lines of output (returncode is None if it could not be run)
+    """
+    import subprocess
+    
+    name = agent_dir.name
+    deploy_script = agent_dir / "deploy_to_hf.py"
+    tail = deque(maxlen=TAIL_LINES)
+    
+    try:
+        # Run the deployment script, streaming stdout and stderr together
+        with subprocess.Popen([
+            sys.executable, str(deploy_script)
+        ], cwd=agent_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+           text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                tail.append(line)
+                with _print_lock:
+                    print(f"[{name}] {line}", end="")
+        return name, proc.returncode, "".join(tail)
+    except Exception as e:
+        return name, None, str(e)
+
 def deploy_all_agents():
     """Deploy all agent repositories to Hugging Face"""
     print("🚀 Deploying all insurance agents to Hugging Face...")
@@ -17,14 +57,18 @@ def deploy_all_agents():
     base_path = Path(__file__).parent.parent
     agent_dirs = []
     
-    for item in base_path.iterdir():
-        if item.is_dir():
-            # Check if it looks like an agent repo (has required files)
-            required_files = ["app.py", "requirements.txt", "README.md", "model_card.md"]
-            has_required = all((item / f).exists() for f in required_files)
-            
-            if has_required and (item / "deploy_to_hf.py").exists():
-                agent_dirs.append(item)
+    with os.scandir(base_path) as it:
+        for item in it:
+            if item.is_dir():
+                # Check if it looks like an agent repo (one listing per directory)
+                try:
+                    with os.scandir(item.path) as entries:
+                        names = {entry.name for entry in entries}
+                except OSError:
+                    continue
+                
+                if _REQUIRED.issubset(names):
+                    agent_dirs.append(Path(item.path))
     
     if not agent_dirs:
         print("❌ No agent repositories found to deploy")
@@ -39,29 +83,26 @@ def deploy_all_agents():
     successful_deploys = 0
     failed_deploys = 0
     
-    for agent_dir in agent_dirs:
-        print(f"\n--- Deploying {agent_dir.name} ---")
-        
-        deploy_script = agent_dir / "deploy_to_hf.py"
+    # Deploys are independent, so run them side by side; results are
+    # reported from this thread as each one finishes
+    with ThreadPoolExecutor(max_workers=min(DEPLOY_CONCURRENCY, len(agent_dirs))) as executor:
+        futures = [executor.submit(_deploy_one, agent_dir) for agent_dir in agent_dirs]
         
-        try:
-            # Run the deployment script
-            result = subprocess.run([
-                sys.executable, str(deploy_script)
-            ], cwd=agent_dir, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print(f"✅ {agent_dir.name} deployed successfully!")
-                successful_deploys += 1
-            else:
-                print(f"❌ {agent_dir.name} deployment failed:")
-                print(result.stdout)
-                print(result.stderr)
-                failed_deploys += 1
+        for future in as_completed(futures):
+            name, returncode, output = future.result()
+            with _print_lock:
+                print(f"\n--- Deploying {name} ---")
                 
-        except Exception as e:
-            print(f"❌ Error deploying {agent_dir.name}: {e}")
-            failed_deploys += 1
+                if returncode == 0:
+                    print(f"✅ {name} deployed successfully!")
+                    successful_deploys += 1
+                elif returncode is None:
+                    print(f"❌ Error deploying {name}: {output}")
+                    failed_deploys += 1
+                else:
+                    print(f"❌ {name} deployment failed:")
+                    print(output)
+                    failed_deploys += 1
     
     print(f"\n--- Deployment Summary ---")
     print(f"Successful: {successful_deploys}")
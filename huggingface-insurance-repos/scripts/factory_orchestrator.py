@@ -8,99 +8,123 @@ import os
 import json
 from pathlib import Path
 from datetime import datetime
-
-class AgentFactory:
-    """Factory for creating insurance AI agent repositories"""
-    
-    def __init__(self, base_path="."):
-        self.base_path = Path(base_path)
-        self.factory_state = {
-            "created_at": datetime.now().isoformat(),
-            "agents": [],
-            "gcc_compliance": True,
-            "human_in_loop": True
-        }
-    
-    def add_agent(self, name, description, use_case_type):
-        """Create a new agent repository"""
-        agent_path = self.base_path / name
-        agent_path.mkdir(exist_ok=True)
-        
-        print(f"\n🏭 Creating agent: {name}")
-        
-        # Create app.py
-        self._create_app_py(agent_path, name, description, use_case_type)
-        
-        # Create README.md
-        self._create_readme(agent_path, name, description, use_case_type)
-        
-        # Create model_card.md
-        self._create_model_card(agent_path, name, description, use_case_type)
-        
-        # Create requirements.txt
-        self._create_requirements(agent_path, use_case_type)
-        
-        # Create deploy_to_hf.py
-        self._create_deploy_script(agent_path, name)
-        
-        # Create synthetic dataset if needed
-        if use_case_type in ["underwriting", "fraud", "claims", "reinsurance"]:
-            self._create_synthetic_data(agent_path, use_case_type)
-        
-        # Update factory state
-        self.factory_state["agents"].append({
-            "name": name,
-            "description": description,
-            "type": use_case_type,
-            "created_at": datetime.now().isoformat()
-        })
-        
-        print(f"✅ Agent {name} created successfully")
-        return agent_path
+from functools import lru_cache
+from string import Template
+
+# Use case types that ship a synthetic_data.csv
+SYNTHETIC_DATA_TYPES = ("underwriting", "fraud", "claims", "reinsurance")
+
+# Generated files that must be executable
+_EXECUTABLE_FILES = frozenset({"deploy_to_hf.py"})
+
+def _write_files(path, files):
+    """Write (filename, UTF-8 bytes) pairs under path, one os.write per file"""
+    for filename, content in files:
+        file_path = os.path.join(path, filename)
+        data = memoryview(content)
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        if filename in _EXECUTABLE_FILES:
+            os.chmod(file_path, 0o755)
+
+def _write_csv(df, path):
+    """
+    Write df as CSV without the index. With pyarrow installed the rows are
+    formatted by its C++ writer (same output as to_csv for these datasets);
+    otherwise, or if a value would need quoting, pandas writes the file
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        df.to_csv(path, index=False)
+        return
     
-    def _create_app_py(self, path, name, description, use_case_type):
-        """Generate Gradio app.py for the agent"""
-        app_content = f'''import gradio as gr
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with open(path, 'wb') as f:
+            # pyarrow always quotes header names, so the header is written here
+            f.write((",".join(map(str, df.columns)) + "\n").encode("utf-8"))
+            pacsv.write_csv(table, f, pacsv.WriteOptions(include_header=False, quoting_style="none"))
+    except pa.ArrowInvalid:
+        df.to_csv(path, index=False)
+
+# Generated app.py; ${...} placeholders are filled by _render
+_APP_TEMPLATE = Template('''import gradio as gr
 import pandas as pd
+import os
 import json
+import time
 from datetime import datetime
-
-# GCC Insurance Agent: {name}
-# {description}
+from functools import lru_cache
+
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+def to_json(obj):
+    """Indented JSON text (orjson when available; same layout as json.dumps(indent=2))"""
+    if USE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# (epoch second, its ISO string): requests within the same second share one string
+_last_ts = [0, ""]
+
+def _now_iso():
+    """Current local time as an ISO string, at one-second resolution"""
+    now = int(time.time())
+    if now != _last_ts[0]:
+        _last_ts[0], _last_ts[1] = now, datetime.fromtimestamp(now).isoformat()
+    return _last_ts[1]
+
+# GCC Insurance Agent: ${name}
+# ${description}
 # Human-in-loop: ALWAYS ENFORCED
 
 def process_request(input_data):
     """
     Process insurance request with human-in-loop validation
     """
-    result = {{
-        "agent": "{name}",
-        "timestamp": datetime.now().isoformat(),
+    result = {
+        "agent": "${name}",
+        "timestamp": _now_iso(),
         "input": input_data,
         "status": "pending_human_review",
         "gcc_compliant": True,
         "recommendation": "Awaiting human approval"
-    }}
-    return json.dumps(result, indent=2)
+    }
+    return to_json(result)
+
+# Keyed on the file's mtime, so the CSV is only parsed again after it changes
+@lru_cache(maxsize=1)
+def _sample_html(mtime):
+    """HTML table of the first 10 rows of the synthetic dataset"""
+    return pd.read_csv("synthetic_data.csv", nrows=10).to_html()
 
 def load_sample_data():
     """Load synthetic sample data"""
     try:
-        df = pd.read_csv("synthetic_data.csv")
-        return df.head(10).to_html()
+        return _sample_html(os.path.getmtime("synthetic_data.csv"))
     except:
         return "No sample data available"
 
 # Gradio Interface
-with gr.Blocks(title="{name}") as demo:
-    gr.Markdown(f"# {name}")
-    gr.Markdown(f"## {description}")
+with gr.Blocks(title="${name}") as demo:
+    gr.Markdown(f"# ${name}")
+    gr.Markdown(f"## ${description}")
     gr.Markdown("### ⚠️ Human-in-Loop: All decisions require human approval")
     
     with gr.Tab("Agent Interface"):
         input_text = gr.Textbox(
             label="Input Data (JSON format)",
-            placeholder='{{"policy_id": "12345", "data": "..."}}')
+            placeholder='{"policy_id": "12345", "data": "..."}')
         output_text = gr.Textbox(label="Agent Response", lines=10)
         submit_btn = gr.Button("Process Request")
         submit_btn.click(process_request, inputs=input_text, outputs=output_text)
@@ -114,8 +138,8 @@ with gr.Blocks(title="{name}") as demo:
     with gr.Tab("About"):
         gr.Markdown(f"""
         ### Agent Information
-        - **Name**: {name}
-        - **Type**: {use_case_type}
+        - **Name**: ${name}
+        - **Type**: ${use_case_type}
         - **GCC Compliant**: Yes
         - **Human-in-Loop**: Enforced
         - **Proprietary Logic**: None (Generic assumptions only)
@@ -129,18 +153,16 @@ with gr.Blocks(title="{name}") as demo:
 
 if __name__ == "__main__":
     demo.launch()
-'''
-        (path / "app.py").write_text(app_content)
-    
-    def _create_readme(self, path, name, description, use_case_type):
-        """Generate README.md"""
-        readme_content = f'''# {name}
+''')
+
+# Generated README.md; ${...} placeholders are filled by _render
+_README_TEMPLATE = Template('''# ${name}
 
 ## Description
-{description}
+${description}
 
 ## Agent Type
-{use_case_type}
+${use_case_type}
 
 ## GCC Insurance Agent Factory
 
@@ -179,13 +201,11 @@ MIT License - Generic GCC Insurance Use Case
 ## Disclaimer
 
 This agent uses generic insurance assumptions and requires human validation for all decisions.
-'''
-        (path / "README.md").write_text(readme_content)
-    
-    def _create_model_card(self, path, name, description, use_case_type):
-        """Generate model_card.md"""
-        model_card = f'''---
-title: {name}
+''')
+
+# Generated model_card.md; ${...} placeholders are filled by _render
+_MODEL_CARD_TEMPLATE = Template('''---
+title: ${name}
 emoji: 🏢
 colorFrom: blue
 colorTo: green
@@ -196,15 +216,15 @@ pinned: false
 license: mit
 ---
 
-# Model Card: {name}
+# Model Card: ${name}
 
 ## Model Description
 
-{description}
+${description}
 
 ## Intended Use
 
-**Primary Use Case**: {use_case_type}
+**Primary Use Case**: ${use_case_type}
 
 **Users**: Insurance professionals, underwriters, claims adjusters, risk analysts
 
@@ -241,118 +261,242 @@ This agent uses synthetic data generated for GCC (Generic Commercial Coverage) i
 ## Contact
 
 Generated by GCC Insurance Agent Factory
-'''
-        (path / "model_card.md").write_text(model_card)
-    
-    def _create_requirements(self, path, use_case_type):
-        """Generate requirements.txt"""
-        requirements = '''gradio>=4.0.0
-pandas>=2.0.0
-numpy>=1.24.0
-scikit-learn>=1.3.0
-'''
-        (path / "requirements.txt").write_text(requirements)
-    
-    def _create_deploy_script(self, path, name):
-        """Generate deploy_to_hf.py"""
-        deploy_script = f'''#!/usr/bin/env python3
+''')
+
+# Generated deploy_to_hf.py; ${...} placeholders are filled by _render
+_DEPLOY_TEMPLATE = Template('''#!/usr/bin/env python3
 """
-Deploy {name} to Hugging Face
+Deploy ${name} to Hugging Face
 """
 
-import os
-import subprocess
 import sys
+from pathlib import Path
+
+SPACE_ID = "gcc-insurance-intelligence-lab/${name}"  # Update with your org
 
 def deploy():
-    print("\n🚀 Deploying {name} to Hugging Face...")
+    print("\\n🚀 Deploying ${name} to Hugging Face...")
     
-    # Check if huggingface-cli is installed
+    # The hub client runs in this process (no huggingface-cli subprocesses)
     try:
-        subprocess.run(["huggingface-cli", "--version"], check=True, capture_output=True)
-    except:
-        print("❌ Error: huggingface-cli not found. Install with: pip install huggingface_hub")
+        from huggingface_hub import CommitOperationAdd, HfApi, create_repo
+    except ImportError:
+        print("❌ Error: huggingface_hub not found. Install with: pip install huggingface_hub")
         sys.exit(1)
     
-    # Check authentication
-    print("\n🔑 Checking Hugging Face authentication...")
-    result = subprocess.run(["huggingface-cli", "whoami"], capture_output=True, text=True)
+    api = HfApi()
     
-    if result.returncode != 0:
+    # Check authentication
+    print("\\n🔑 Checking Hugging Face authentication...")
+    try:
+        user = api.whoami()
+    except Exception:
         print("❌ Not logged in to Hugging Face")
         print("Please run: huggingface-cli login")
         sys.exit(1)
     
-    print(f"✅ Authenticated as: {{result.stdout.strip()}}")
+    print(f"✅ Authenticated as: {user['name']}")
     
     # Create space
-    space_name = "{name}"
-    org_name = "gcc-insurance-intelligence-lab"  # Update with your org
+    print(f"\\n🏭 Creating Hugging Face Space: {SPACE_ID}")
+    create_repo(SPACE_ID, repo_type="space", space_sdk="gradio", exist_ok=True)
     
-    print(f"\n🏭 Creating Hugging Face Space: {{org_name}}/{{space_name}}")
+    # Every file of the agent goes up in one commit (one request, not one per file)
+    operations = [
+        CommitOperationAdd(path_in_repo=path.name, path_or_fileobj=str(path))
+        for path in sorted(Path(".").iterdir()) if path.is_file()
+    ]
+    print(f"📤 Uploading {len(operations)} files in one commit...")
+    api.create_commit(
+        repo_id=SPACE_ID,
+        repo_type="space",
+        operations=operations,
+        commit_message="Initial factory deploy"
+    )
     
-    # Note: Actual deployment would use huggingface_hub API
-    print("⚠️  Manual deployment required:")
-    print(f"   1. Create space at: https://huggingface.co/new-space")
-    print(f"   2. Name: {{space_name}}")
-    print(f"   3. Upload files from this directory")
-    print(f"   4. Or use: huggingface-cli upload {{org_name}}/{{space_name}} . --repo-type=space")
-    
-    print("\n✅ Deployment instructions provided")
+    print(f"\\n✅ Deployed to https://huggingface.co/spaces/{SPACE_ID}")
 
 if __name__ == "__main__":
     deploy()
+''')
+
+@lru_cache(maxsize=256)
+def _render(template, name, description="", use_case_type=""):
+    """
+    Fill a file template and encode it as UTF-8 (memoized: regenerating an
+    agent reuses the bytes, skipping both the substitution and the encode)
+    """
+    return template.substitute(
+        name=name, description=description, use_case_type=use_case_type
+    ).encode("utf-8")
+
+class AgentFactory:
+    """Factory for creating insurance AI agent repositories"""
+    
+    def __init__(self, base_path="."):
+        self.base_path = Path(base_path)
+        self.factory_state = {
+            "created_at": datetime.now().isoformat(),
+            "agents": [],
+            "gcc_compliance": True,
+            "human_in_loop": True
+        }
+    
+    def add_agent(self, name, description, use_case_type, created_at=None):
+        """Create a new agent repository (created_at defaults to now, as an ISO string)"""
+        agent_path = self.base_path / name
+        agent_path.mkdir(exist_ok=True)
+        
+        print(f"\n🏭 Creating agent: {name}")
+        
+        # Create app.py, README.md, model_card.md, requirements.txt and
+        # deploy_to_hf.py in one pass (one open/write/close each)
+        _write_files(agent_path, self._agent_files(name, description, use_case_type))
+        
+        # Create synthetic dataset if needed
+        if use_case_type in SYNTHETIC_DATA_TYPES:
+            self._create_synthetic_data(agent_path, use_case_type)
+        
+        self._record_agent(name, description, use_case_type, created_at)
+        
+        print(f"✅ Agent {name} created successfully")
+        return agent_path
+    
+    def add_agents(self, agents):
+        """
+        Create an agent repository for each (name, description, use_case_type)
+        in agents; the batch shares one created_at timestamp
+        """
+        created_at = datetime.now().isoformat()
+        return [
+            self.add_agent(name, description, use_case_type, created_at)
+            for name, description, use_case_type in agents
+        ]
+    
+    def add_agent_to_zip(self, zf, name, description, use_case_type, created_at=None):
+        """Write a new agent repository into zf (a zipfile.ZipFile) under name/"""
+        print(f"\n🏭 Creating agent: {name}")
+        
+        for filename, content in self._agent_files(name, description, use_case_type):
+            zf.writestr(f"{name}/{filename}", content)
+        
+        if use_case_type in SYNTHETIC_DATA_TYPES:
+            df = self._synthetic_dataframe(use_case_type)
+            zf.writestr(f"{name}/synthetic_data.csv", df.to_csv(index=False))
+        
+        self._record_agent(name, description, use_case_type, created_at)
+        
+        print(f"✅ Agent {name} created successfully")
+    
+    def _agent_files(self, name, description, use_case_type):
+        """Generated (filename, UTF-8 bytes) pairs for an agent repository"""
+        return [
+            self._create_app_py(name, description, use_case_type),
+            self._create_readme(name, description, use_case_type),
+            self._create_model_card(name, description, use_case_type),
+            self._create_requirements(use_case_type),
+            self._create_deploy_script(name),
+        ]
+    
+    def _record_agent(self, name, description, use_case_type, created_at=None):
+        """Update factory state"""
+        self.factory_state["agents"].append({
+            "name": name,
+            "description": description,
+            "type": use_case_type,
+            "created_at": created_at or datetime.now().isoformat()
+        })
+    
+    def _create_app_py(self, name, description, use_case_type):
+        """Generate Gradio app.py for the agent"""
+        return "app.py", _render(_APP_TEMPLATE, name, description, use_case_type)
+    
+    def _create_readme(self, name, description, use_case_type):
+        """Generate README.md"""
+        return "README.md", _render(_README_TEMPLATE, name, description, use_case_type)
+    
+    def _create_model_card(self, name, description, use_case_type):
+        """Generate model_card.md"""
+        return "model_card.md", _render(_MODEL_CARD_TEMPLATE, name, description, use_case_type)
+    
+    def _create_requirements(self, use_case_type):
+        """Generate requirements.txt"""
+        requirements = b'''gradio>=4.0.0
+pandas>=2.0.0
+numpy>=1.24.0
+scikit-learn>=1.3.0
+orjson>=3.9.0
 '''
-        (path / "deploy_to_hf.py").write_text(deploy_script)
-        os.chmod(path / "deploy_to_hf.py", 0o755)
+        return "requirements.txt", requirements
+    
+    def _create_deploy_script(self, name):
+        """Generate deploy_to_hf.py"""
+        return "deploy_to_hf.py", _render(_DEPLOY_TEMPLATE, name)
     
     def _create_synthetic_data(self, path, use_case_type):
         """Generate synthetic dataset"""
+        df = self._synthetic_dataframe(use_case_type)
+        _write_csv(df, path / "synthetic_data.csv")
+    
+    def _synthetic_dataframe(self, use_case_type):
+        """Build the synthetic dataset for a use case type"""
         import pandas as pd
         import numpy as np
         
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
+        
+        def ids(prefix):
+            # PREFIX000001..PREFIX000100, built in one vectorized pass
+            return np.char.add(prefix, np.char.zfill(np.arange(1, 101).astype(str), 6))
         
+        # Columns drawn from the same distribution come from one call: the
+        # (k, 1) bounds give a (k, 100) array whose rows are the columns
         if use_case_type == "underwriting":
+            age, coverage, premium = rng.integers(
+                [[25], [100000], [500]], [[70], [1000000], [5000]], size=(3, 100)
+            )
             data = {
-                "policy_id": [f"POL{i:06d}" for i in range(1, 101)],
-                "applicant_age": np.random.randint(25, 70, 100),
-                "coverage_amount": np.random.randint(100000, 1000000, 100),
-                "risk_score": np.random.uniform(0.1, 0.9, 100),
-                "premium_estimate": np.random.randint(500, 5000, 100)
+                "policy_id": ids("POL"),
+                "applicant_age": age,
+                "coverage_amount": coverage,
+                "risk_score": rng.uniform(0.1, 0.9, 100),
+                "premium_estimate": premium
             }
         elif use_case_type == "fraud":
+            amount, red_flags = rng.integers([[1000], [0]], [[100000], [5]], size=(2, 100))
             data = {
-                "claim_id": [f"CLM{i:06d}" for i in range(1, 101)],
-                "claim_amount": np.random.randint(1000, 100000, 100),
-                "fraud_score": np.random.uniform(0.0, 1.0, 100),
-                "red_flags": np.random.randint(0, 5, 100),
-                "investigation_priority": np.random.choice(["low", "medium", "high"], 100)
+                "claim_id": ids("CLM"),
+                "claim_amount": amount,
+                "fraud_score": rng.uniform(0.0, 1.0, 100),
+                "red_flags": red_flags,
+                "investigation_priority": rng.choice(["low", "medium", "high"], 100)
             }
         elif use_case_type == "claims":
+            amount, days = rng.integers([[5000], [1]], [[50000], [30]], size=(2, 100))
             data = {
-                "claim_id": [f"CLM{i:06d}" for i in range(1, 101)],
-                "loss_type": np.random.choice(["property", "liability", "auto"], 100),
-                "claim_amount": np.random.randint(5000, 50000, 100),
-                "processing_time_days": np.random.randint(1, 30, 100),
-                "status": np.random.choice(["pending", "approved", "denied"], 100)
+                "claim_id": ids("CLM"),
+                "loss_type": rng.choice(["property", "liability", "auto"], 100),
+                "claim_amount": amount,
+                "processing_time_days": days,
+                "status": rng.choice(["pending", "approved", "denied"], 100)
             }
         elif use_case_type == "reinsurance":
+            retention, premium_rate = rng.uniform([[0.1], [0.01]], [[0.5], [0.1]], size=(2, 100))
             data = {
-                "treaty_id": [f"TRT{i:06d}" for i in range(1, 101)],
-                "exposure_amount": np.random.randint(1000000, 10000000, 100),
-                "retention_rate": np.random.uniform(0.1, 0.5, 100),
-                "premium_rate": np.random.uniform(0.01, 0.1, 100),
-                "risk_category": np.random.choice(["cat", "casualty", "specialty"], 100)
+                "treaty_id": ids("TRT"),
+                "exposure_amount": rng.integers(1000000, 10000000, 100),
+                "retention_rate": retention,
+                "premium_rate": premium_rate,
+                "risk_category": rng.choice(["cat", "casualty", "specialty"], 100)
             }
         else:
             data = {
                 "id": range(1, 101),
-                "value": np.random.uniform(0, 100, 100)
+                "value": rng.uniform(0, 100, 100)
             }
         
-        df = pd.DataFrame(data)
-        df.to_csv(path / "synthetic_data.csv", index=False)
+        # The columns are freshly generated arrays, so pandas can adopt them as-is
+        return pd.DataFrame(data, copy=False)
     
     def status(self):
         """Print factory status"""
@@ -13,13 +13,19 @@ from datetime import datetime
 import sys
 from pathlib import Path
 
-# Add logging
-sys.path.append(str(Path(__file__).parent.parent / "automation" / "scripts"))
-try:
-    from logger_utility import AppLogger
-    logger = AppLogger("test-use-case")
-except ImportError:
-    logger = None
+# Add logging (Streamlit reruns this script on every interaction, so the
+# path is added once and the logger is built once per process)
+_SCRIPTS_DIR = str(Path(__file__).parent.parent / "automation" / "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.append(_SCRIPTS_DIR)
+
+@st.cache_resource(show_spinner=False)
+def _get_logger():
+    try:
+        from logger_utility import AppLogger
+    except ImportError:
+        return None
+    return AppLogger("test-use-case")
 
 # Page config
 st.set_page_config(
@@ -28,6 +34,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Built after set_page_config, which must be the first Streamlit command
+logger = _get_logger()
+
 # Header
 st.title("🏢 Test Use Case")
 st.markdown("Test use case for validation")
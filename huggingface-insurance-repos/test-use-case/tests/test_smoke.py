@@ -3,12 +3,26 @@
 Smoke tests for test-use-case
 """
 
+import os
+import re
 import pytest
 import sys
-from pathlib import Path
+
+# Repository root (parent of tests/), resolved once for every test
+_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Terms the README must contain, matched in one pass by a single regex
+_GOVERNANCE_TERMS = (
+    "Synthetic Data Only",
+    "Human-in-Loop",
+    "No Pricing Authority",
+    "No Payout Authority",
+    "No Underwriting Authority",
+)
+_GOV_RE = re.compile("|".join(map(re.escape, _GOVERNANCE_TERMS)))
 
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, _BASE)
 
 def test_imports():
     """Test that all required imports work"""
@@ -22,39 +36,27 @@ def test_imports():
 
 def test_app_file_exists():
     """Test that app.py exists"""
-    app_path = Path(__file__).parent.parent / "app.py"
-    assert app_path.exists(), "app.py not found"
+    assert os.path.isfile(os.path.join(_BASE, "app.py")), "app.py not found"
 
 def test_readme_exists():
     """Test that README.md exists"""
-    readme_path = Path(__file__).parent.parent / "README.md"
-    assert readme_path.exists(), "README.md not found"
+    assert os.path.isfile(os.path.join(_BASE, "README.md")), "README.md not found"
 
 def test_model_card_exists():
     """Test that model_card.md exists"""
-    model_card_path = Path(__file__).parent.parent / "model_card.md"
-    assert model_card_path.exists(), "model_card.md not found"
+    assert os.path.isfile(os.path.join(_BASE, "model_card.md")), "model_card.md not found"
 
 def test_requirements_exists():
     """Test that requirements.txt exists"""
-    req_path = Path(__file__).parent.parent / "requirements.txt"
-    assert req_path.exists(), "requirements.txt not found"
+    assert os.path.isfile(os.path.join(_BASE, "requirements.txt")), "requirements.txt not found"
 
 def test_governance_disclaimers():
     """Test that governance disclaimers are present"""
-    readme_path = Path(__file__).parent.parent / "README.md"
-    content = readme_path.read_text()
-    
-    required_terms = [
-        "Synthetic Data Only",
-        "Human-in-Loop",
-        "No Pricing Authority",
-        "No Payout Authority",
-        "No Underwriting Authority"
-    ]
+    with open(os.path.join(_BASE, "README.md"), 'r', encoding='utf-8') as f:
+        content = f.read()
     
-    for term in required_terms:
-        assert term in content, f"Missing governance term: {term}"
+    missing = set(_GOVERNANCE_TERMS).difference(_GOV_RE.findall(content))
+    assert not missing, f"Missing governance terms: {sorted(missing)}"
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
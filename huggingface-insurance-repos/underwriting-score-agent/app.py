@@ -1,31 +1,47 @@
 import gradio as gr
 import json
-import random
-import spaces
+from functools import lru_cache
 
-@spaces.GPU(duration=30)
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+def to_json(obj):
+    """Indented JSON text (orjson when available; same layout as json.dumps(indent=2))"""
+    if USE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Industry risk factors
+INDUSTRY_FACTORS = {
+    'Manufacturing': 1.2,
+    'Retail': 1.0,
+    'Healthcare': 1.3,
+    'Technology': 0.8,
+    'Construction': 1.5
+}
+
+# Profile bias
+PROFILE_BIAS = {
+    'Low': 0.0,
+    'Medium': 1.0,
+    'High': 2.0
+}
+
+# Results depend only on the three inputs, so repeat requests are served from cache
+@lru_cache(maxsize=128)
 def calculate_underwriting_score(industry_segment, applicant_risk_profile, prior_claim_count):
     """Calculate underwriting risk score based on inputs"""
-    # Industry risk factors
-    industry_factors = {
-        'Manufacturing': 1.2,
-        'Retail': 1.0,
-        'Healthcare': 1.3,
-        'Technology': 0.8,
-        'Construction': 1.5
-    }
-    industry_factor = industry_factors.get(industry_segment, 1.0)
+    # Industry risk factor
+    industry_factor = INDUSTRY_FACTORS.get(industry_segment, 1.0)
     
     # History factor: prior_claims * 0.15
     history_factor = prior_claim_count * 0.15
     
     # Profile bias
-    profile_bias_map = {
-        'Low': 0.0,
-        'Medium': 1.0,
-        'High': 2.0
-    }
-    profile_bias = profile_bias_map.get(applicant_risk_profile, 1.0)
+    profile_bias = PROFILE_BIAS.get(applicant_risk_profile, 1.0)
     
     # Calculate composite score
     composite_score = (industry_factor + history_factor + profile_bias) / 3
@@ -52,7 +68,7 @@ def calculate_underwriting_score(industry_segment, applicant_risk_profile, prior
         "Composite Score": round(composite_score, 2)
     }
     
-    return risk_band, color, recommendation, json.dumps(factor_breakdown, indent=2)
+    return risk_band, color, recommendation, to_json(factor_breakdown)
 
 agent_title = "Underwriting Score Agent"
 with gr.Blocks(theme=gr.themes.Soft(), title=agent_title) as demo:
@@ -4,10 +4,11 @@ This script deploys the underwriting-score-agent to Hugging Face Spaces
 """
 
 import os
-from huggingface_hub import HfApi, create_repo
 
 def deploy_to_hf():
     """Deploy to Hugging Face"""
+    from huggingface_hub import HfApi, create_repo
+    
     api = HfApi()
     
     # Repository details
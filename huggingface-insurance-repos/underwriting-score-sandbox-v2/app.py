@@ -1,71 +1,33 @@
 import gradio as gr
 import json
+import math
+from bisect import bisect_right
+from itertools import product
 
-def calculate_underwriting_risk(industry_segment, applicant_risk_profile, prior_claim_count):
-    """
-    Calculate underwriting risk score based on rule-based logic
-    
-    Args:
-        industry_segment: Industry category
-        applicant_risk_profile: Risk profile (Low/Medium/High)
-        prior_claim_count: Number of prior claims (0-10)
-    
-    Returns:
-        Risk band, factor breakdown, and explanation
-    """
-    
-    # 1. Industry risk factors
-    industry_factors = {
-        'Manufacturing': 1.2,
-        'Retail': 1.0,
-        'Healthcare': 1.3,
-        'Technology': 0.8,
-        'Construction': 1.5
-    }
-    industry_factor = industry_factors.get(industry_segment, 1.0)
-    
-    # 2. History factor: prior_claims * 0.15
-    history_factor = prior_claim_count * 0.15
-    
-    # 3. Profile bias
-    profile_bias_map = {
-        'Low': 0.0,
-        'Medium': 1.0,
-        'High': 2.0
-    }
-    profile_bias = profile_bias_map.get(applicant_risk_profile, 1.0)
-    
-    # 4. Aggregate score = industry_factor + history_factor + profile_bias
-    aggregate_score = industry_factor + history_factor + profile_bias
-    
-    # 5. Risk band determination
-    if aggregate_score < 1.5:
-        risk_band = "Low"
-        risk_color = "🟢"
-    elif aggregate_score <= 3.0:
-        risk_band = "Medium"
-        risk_color = "🟡"
-    else:
-        risk_band = "High"
-        risk_color = "🔴"
-    
-    # Build factor breakdown
-    factor_breakdown = {
-        "industry_segment": industry_segment,
-        "industry_factor": round(industry_factor, 2),
-        "prior_claim_count": prior_claim_count,
-        "history_factor": round(history_factor, 2),
-        "applicant_risk_profile": applicant_risk_profile,
-        "profile_bias": round(profile_bias, 2),
-        "aggregate_score": round(aggregate_score, 2),
-        "risk_band": risk_band
-    }
-    
-    # Format factor breakdown as JSON
-    factor_json = json.dumps(factor_breakdown, indent=2)
-    
-    # Build detailed explanation
-    explanation = f"""# {risk_color} Underwriting Risk Assessment: {risk_band}
+# Industry risk factors
+INDUSTRY_FACTORS = {
+    'Manufacturing': 1.2,
+    'Retail': 1.0,
+    'Healthcare': 1.3,
+    'Technology': 0.8,
+    'Construction': 1.5
+}
+
+# Profile bias
+PROFILE_BIAS = {
+    'Low': 0.0,
+    'Medium': 1.0,
+    'High': 2.0
+}
+
+# Aggregate score bands: Low below 1.5, Medium from 1.5 up to and including
+# 3.0, High above 3.0 (the upper bound is nudged so 3.0 itself stays Medium)
+RISK_BAND_THRESHOLDS = (1.5, math.nextafter(3.0, math.inf))
+# (risk band, color) per band
+RISK_BANDS = (("Low", "🟢"), ("Medium", "🟡"), ("High", "🔴"))
+
+# Detailed analysis and quick summary, filled in with str.format_map per request
+EXPLANATION_TEMPLATE = """# {risk_color} Underwriting Risk Assessment: {risk_band}
 
 ## Aggregate Risk Score: {aggregate_score:.2f}
 
@@ -110,9 +72,8 @@ This tool demonstrates fictional insurance logic using synthetic data only. No o
 
 **Human-in-the-loop is mandatory for all insurance decisions.**
 """
-    
-    # Summary output
-    summary = f"""**Risk Band:** {risk_color} {risk_band}
+
+SUMMARY_TEMPLATE = """**Risk Band:** {risk_color} {risk_band}
 **Aggregate Score:** {aggregate_score:.2f}
 **Underwriter Review:** REQUIRED
 
@@ -120,9 +81,83 @@ This tool demonstrates fictional insurance logic using synthetic data only. No o
 - Industry Factor: {industry_factor:.2f}
 - History Factor: {history_factor:.2f}
 - Profile Bias: {profile_bias:.2f}"""
+
+def calculate_underwriting_risk(industry_segment, applicant_risk_profile, prior_claim_count):
+    """
+    Calculate underwriting risk score based on rule-based logic
+    
+    Args:
+        industry_segment: Industry category
+        applicant_risk_profile: Risk profile (Low/Medium/High)
+        prior_claim_count: Number of prior claims (0-10)
+    
+    Returns:
+        Risk band, factor breakdown, and explanation
+    """
+    
+    # 1. Industry risk factor
+    industry_factor = INDUSTRY_FACTORS.get(industry_segment, 1.0)
+    
+    # 2. History factor: prior_claims * 0.15
+    history_factor = prior_claim_count * 0.15
+    
+    # 3. Profile bias
+    profile_bias = PROFILE_BIAS.get(applicant_risk_profile, 1.0)
+    
+    # 4. Aggregate score = industry_factor + history_factor + profile_bias
+    aggregate_score = industry_factor + history_factor + profile_bias
+    
+    # 5. Risk band determination
+    risk_band, risk_color = RISK_BANDS[bisect_right(RISK_BAND_THRESHOLDS, aggregate_score)]
+    
+    # Build factor breakdown
+    factor_breakdown = {
+        "industry_segment": industry_segment,
+        "industry_factor": round(industry_factor, 2),
+        "prior_claim_count": prior_claim_count,
+        "history_factor": round(history_factor, 2),
+        "applicant_risk_profile": applicant_risk_profile,
+        "profile_bias": round(profile_bias, 2),
+        "aggregate_score": round(aggregate_score, 2),
+        "risk_band": risk_band
+    }
+    
+    # Format factor breakdown as JSON
+    factor_json = json.dumps(factor_breakdown, indent=2)
+    
+    # Build detailed explanation and summary
+    fields = {
+        "risk_color": risk_color,
+        "risk_band": risk_band,
+        "aggregate_score": aggregate_score,
+        "industry_segment": industry_segment,
+        "industry_factor": industry_factor,
+        "prior_claim_count": prior_claim_count,
+        "history_factor": history_factor,
+        "applicant_risk_profile": applicant_risk_profile,
+        "profile_bias": profile_bias,
+    }
+    explanation = EXPLANATION_TEMPLATE.format_map(fields)
+    summary = SUMMARY_TEMPLATE.format_map(fields)
     
     return explanation, summary, factor_json, aggregate_score
 
+# Every input the UI can send (5 industries x 3 profiles x 0-10 claims), scored once at import
+_RESULTS = {
+    key: calculate_underwriting_risk(*key)
+    for key in product(INDUSTRY_FACTORS, PROFILE_BIAS, range(11))
+}
+
+def assess_underwriting_risk(industry_segment, applicant_risk_profile, prior_claim_count):
+    """Look up the precomputed assessment (computed directly for inputs outside the table)"""
+    # Only int claim counts hit the table: a float such as 5.0 hashes like 5
+    # but is echoed as "5.0" in the output
+    if type(prior_claim_count) is int:
+        result = _RESULTS.get((industry_segment, applicant_risk_profile, prior_claim_count))
+        if result is not None:
+            return result
+    return calculate_underwriting_risk(industry_segment, applicant_risk_profile, prior_claim_count)
+
 # Create Gradio interface
 with gr.Blocks(title="Underwriting Score Sandbox", theme=gr.themes.Soft()) as demo:
     gr.Markdown("""
@@ -199,7 +234,7 @@ with gr.Blocks(title="Underwriting Score Sandbox", theme=gr.themes.Soft()) as de
     
     # Connect button to function
     calculate_btn.click(
-        fn=calculate_underwriting_risk,
+        fn=assess_underwriting_risk,
         inputs=[industry_segment, applicant_risk_profile, prior_claim_count],
         outputs=[detailed_explanation, summary_output, factor_breakdown_output, aggregate_score_output]
     )
@@ -1,56 +1,38 @@
 import gradio as gr
-import pandas as pd
-import json
+import sys
+from functools import lru_cache
 from underwriting_rules import UnderwritingScorer
 
 # Initialize the underwriting scorer
 scorer = UnderwritingScorer()
 
-# Load synthetic data for reference
-try:
-    df_profiles = pd.read_csv("risk_profiles_synthetic.csv")
-    print(f"✓ Loaded {len(df_profiles)} synthetic risk profiles")
-except:
-    df_profiles = None
-    print("⚠️ Could not load risk profiles data")
+# Outputs depend only on the three inputs, so repeat clicks are served from cache
+@lru_cache(maxsize=512)
+def _score_outputs(industry_segment, applicant_risk_profile, prior_claim_count):
+    """(explanation, summary, aggregate score, factor JSON) for one input combination"""
+    # Score the applicant (interned inputs match the scorer's keys by identity)
+    result = scorer.score_applicant(
+        industry_segment=sys.intern(str(industry_segment)),
+        applicant_risk_profile=sys.intern(str(applicant_risk_profile)),
+        prior_claim_count=prior_claim_count
+    )
+    
+    # Every output is prepared by the scorer
+    return result['explanation'], result['summary'], result['aggregate_score'], result['factor_json']
 
 def score_underwriting_risk(industry_segment, applicant_risk_profile, prior_claim_count):
     """Score underwriting risk based on inputs"""
     
-    try:
-        # Score the applicant
-        result = scorer.score_applicant(
-            industry_segment=industry_segment,
-            applicant_risk_profile=applicant_risk_profile,
-            prior_claim_count=int(prior_claim_count)
-        )
-        
-        # Format output
-        risk_band = result['risk_band']
-        aggregate_score = result['aggregate_score']
-        factor_breakdown = result['factor_breakdown']
-        explanation = result['explanation']
-        
-        # Create factor breakdown JSON display
-        factor_json = json.dumps(factor_breakdown, indent=2)
-        
-        # Summary
-        summary = f"""**Risk Band:** {risk_band}
-**Aggregate Score:** {aggregate_score:.3f}
-**Underwriter Review:** Required
-
-**Factor Breakdown:**
-{factor_json}"""
-        
-        return explanation, summary, aggregate_score, factor_json
-        
-    except Exception as e:
-        error_msg = f"Error processing underwriting score: {str(e)}"
+    # The inputs only offer scorable values, so anything else is rejected up front
+    if not scorer.is_supported(industry_segment, applicant_risk_profile, prior_claim_count):
+        error_msg = "Invalid input: choose an industry segment, a risk profile and 0-10 prior claims"
         return error_msg, error_msg, 0.0, "{}"
+    
+    # The slider may send whole-number floats; int() keeps one cache entry per count
+    return _score_outputs(industry_segment, applicant_risk_profile, int(prior_claim_count))
 
-# Create Gradio interface
-with gr.Blocks(title="Underwriting Score Sandbox", theme=gr.themes.Soft()) as demo:
-    gr.Markdown("""
+# Static page text, built once at import
+_DISCLAIMER_MD = """
     # 🏢 Underwriting Score Sandbox
     
     **Educational Underwriting Risk Scoring System**
@@ -69,7 +51,77 @@ with gr.Blocks(title="Underwriting Score Sandbox", theme=gr.themes.Soft()) as de
     - ✅ Human-in-the-loop required for all decisions
     
     **This tool provides advisory risk bands only. Final underwriting decisions must be made by qualified insurance underwriters.**
-    """)
+    """
+
+_ABOUT_MD = """
+        ## How It Works
+        
+        This underwriting risk scorer uses **rule-based logic** to assess insurance applicant risk:
+        
+        ### Input Factors
+        
+        1. **Industry Segment** (Weight: 40%)
+           - Different industries have varying inherent risk levels
+           - Range: Technology (lowest) to Construction (highest)
+        
+        2. **Prior Claim History** (Weight: 35%)
+           - Number of insurance claims filed in past 5 years
+           - 0 claims = excellent, 7+ claims = high risk
+        
+        3. **Applicant Risk Profile** (Weight: 25%)
+           - Initial risk assessment from application review
+           - Low / Medium / High categories
+        
+        ### Risk Bands
+        
+        - **Low (0.00 - 0.29)**: Standard underwriting, minimal documentation
+        - **Medium (0.30 - 0.59)**: Enhanced review, additional documentation required
+        - **High (0.60 - 1.00)**: Detailed assessment, risk controls recommended
+        
+        ### Calculation Method
+        
+        ```
+        Aggregate Score = (Industry × 0.40) + (History × 0.35) + (Profile × 0.25)
+        Risk Band = Map score to Low/Medium/High thresholds
+        ```
+        
+        ### Governance & Safety
+        
+        - ✅ Rule-based (no machine learning)
+        - ✅ Transparent scoring logic
+        - ✅ Explainable factors
+        - ✅ Mandatory underwriter review
+        - ✅ No automated decisions
+        - ✅ Advisory output only
+        
+        ### Use Cases
+        
+        - **Training**: Teach underwriting concepts
+        - **Process Design**: Test risk assessment workflows
+        - **Education**: Demonstrate insurance risk scoring
+        - **Prototyping**: Validate underwriting logic
+        
+        ### Technical Details
+        
+        - **Framework**: Gradio
+        - **Logic**: Rule-based scoring engine
+        - **Data**: 200 synthetic risk profiles
+        - **Dependencies**: gradio, pandas, numpy
+        
+        ### Limitations
+        
+        - Educational demonstration only
+        - Synthetic data with no real-world validation
+        - Simplified scoring model
+        - No integration with actual underwriting systems
+        - Not suitable for production use
+        
+        **Built for GCC Insurance Intelligence Lab**
+        """
+
+# Create Gradio interface
+with gr.Blocks(title="Underwriting Score Sandbox", theme=gr.themes.Soft(), analytics_enabled=False) as demo:
+    gr.Markdown(_DISCLAIMER_MD)
     
     with gr.Row():
         with gr.Column():
@@ -140,72 +192,8 @@ with gr.Blocks(title="Underwriting Score Sandbox", theme=gr.themes.Soft()) as de
     )
     
     with gr.Accordion("ℹ️ About This Tool", open=False):
-        gr.Markdown("""
-        ## How It Works
-        
-        This underwriting risk scorer uses **rule-based logic** to assess insurance applicant risk:
-        
-        ### Input Factors
-        
-        1. **Industry Segment** (Weight: 40%)
-           - Different industries have varying inherent risk levels
-           - Range: Technology (lowest) to Construction (highest)
-        
-        2. **Prior Claim History** (Weight: 35%)
-           - Number of insurance claims filed in past 5 years
-           - 0 claims = excellent, 7+ claims = high risk
-        
-        3. **Applicant Risk Profile** (Weight: 25%)
-           - Initial risk assessment from application review
-           - Low / Medium / High categories
-        
-        ### Risk Bands
-        
-        - **Low (0.00 - 0.29)**: Standard underwriting, minimal documentation
-        - **Medium (0.30 - 0.59)**: Enhanced review, additional documentation required
-        - **High (0.60 - 1.00)**: Detailed assessment, risk controls recommended
-        
-        ### Calculation Method
-        
-        ```
-        Aggregate Score = (Industry × 0.40) + (History × 0.35) + (Profile × 0.25)
-        Risk Band = Map score to Low/Medium/High thresholds
-        ```
-        
-        ### Governance & Safety
-        
-        - ✅ Rule-based (no machine learning)
-        - ✅ Transparent scoring logic
-        - ✅ Explainable factors
-        - ✅ Mandatory underwriter review
-        - ✅ No automated decisions
-        - ✅ Advisory output only
-        
-        ### Use Cases
-        
-        - **Training**: Teach underwriting concepts
-        - **Process Design**: Test risk assessment workflows
-        - **Education**: Demonstrate insurance risk scoring
-        - **Prototyping**: Validate underwriting logic
-        
-        ### Technical Details
-        
-        - **Framework**: Gradio
-        - **Logic**: Rule-based scoring engine
-        - **Data**: 200 synthetic risk profiles
-        - **Dependencies**: gradio, pandas, numpy
-        
-        ### Limitations
-        
-        - Educational demonstration only
-        - Synthetic data with no real-world validation
-        - Simplified scoring model
-        - No integration with actual underwriting systems
-        - Not suitable for production use
-        
-        **Built for GCC Insurance Intelligence Lab**
-        """
-        )
+        gr.Markdown(_ABOUT_MD)
 
 if __name__ == "__main__":
-    demo.launch()
+    # Scoring is a cached lookup, so several clicks can run at once
+    demo.queue(max_size=32, default_concurrency_limit=8).launch(show_api=False)
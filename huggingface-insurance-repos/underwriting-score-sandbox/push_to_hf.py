@@ -24,29 +24,36 @@ def push_space():
         private=False
     )
     
-    # Upload all files
-    files_to_upload = [
+    # Upload all present files in a single commit
+    files_to_upload = []
+    for filename in [
         "app.py",
         "requirements.txt", 
         "README.md",
         "model_card.md",
         "underwriting_rules.py",
         "risk_profiles_synthetic.csv"
-    ]
-    
-    for filename in files_to_upload:
+    ]:
         if os.path.exists(filename):
-            print(f"Uploading {filename}...")
-            api.upload_file(
-                path_or_fileobj=f"./{filename}",
-                path_in_repo=filename,
-                repo_id=repo_id,
-                repo_type=repo_type
-            )
-            print(f"✓ {filename} uploaded")
+            files_to_upload.append(filename)
         else:
             print(f"⚠️ {filename} not found")
     
+    if not files_to_upload:
+        print("❌ No files to upload, nothing pushed")
+        return
+    
+    print(f"Uploading {', '.join(files_to_upload)}...")
+    api.upload_folder(
+        folder_path=".",
+        repo_id=repo_id,
+        repo_type=repo_type,
+        allow_patterns=files_to_upload,
+        commit_message="Publish underwriting-score-sandbox"
+    )
+    for filename in files_to_upload:
+        print(f"✓ {filename} uploaded")
+    
     print(f"\n✅ Repository {repo_id} has been updated on Hugging Face Hub!")
     print(f"URL: https://huggingface.co/spaces/{repo_id}")
 
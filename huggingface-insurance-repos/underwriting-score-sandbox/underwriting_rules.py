@@ -3,12 +3,76 @@ Underwriting Risk Scoring Rules Engine
 100% rule-based, no ML, synthetic only
 """
 
+import json
+import math
+import sys
+from bisect import bisect_right
+
+import numpy as np
+
+# Numba is optional: batch scoring falls back to a plain Python loop
+try:
+    from numba import njit, prange
+    USE_NUMBA = True
+except ImportError:
+    USE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Profile risk factors
+_PROFILE_FACTORS = {
+    'Low': 0.0,
+    'Medium': 0.30,
+    'High': 0.70
+}
+
+# History factor by prior claim count: 0, 1-2, 3-4, 5-6, and 7 or more claims
+_HISTORY_FACTORS = (0.0, 0.15, 0.15, 0.35, 0.35, 0.60, 0.60, 0.85, 0.85, 0.85, 0.85)
+
+# Lookup arrays for score_batch; the extra last profile entry is the 0.30
+# default given to unknown profiles
+_PROFILE_CODES = {name: i for i, name in enumerate(_PROFILE_FACTORS)}
+_PROFILE_LUT = np.array(list(_PROFILE_FACTORS.values()) + [0.30], dtype=np.float64)
+_HISTORY_LUT = np.array(_HISTORY_FACTORS, dtype=np.float64)
+
+# Aggregate score bands: Low below 0.30, Medium below 0.60, High from 0.60
+_RISK_BAND_THRESHOLDS = (0.30, 0.60)
+_RISK_BANDS = ('Low', 'Medium', 'High')
+# The same bands as arrays, for np.searchsorted(side='right') in batch_score_df
+_RISK_BAND_EDGES = np.array(_RISK_BAND_THRESHOLDS, dtype=np.float64)
+_RISK_BAND_NAMES = np.array(_RISK_BANDS)
+
+# Recommendation paragraph of the explanation, by risk band
+_RECOMMENDATIONS = {
+    'Low': "✅ Standard underwriting process may proceed. "
+           "Minimal additional documentation required.",
+    'Medium': "⚠️ Enhanced underwriting review recommended. "
+              "Request additional documentation and risk mitigation measures.",
+    'High': "🚨 High-risk applicant requiring detailed underwriting assessment. "
+            "Consider risk controls, higher deductibles, or coverage limitations.",
+}
+
+@njit(parallel=True, cache=True)
+def _score_kernel(industries, profiles, claims, industry_lut, profile_lut, history_lut, out):
+    # Same weights and order of operations as calculate_aggregate_score
+    for i in prange(industries.shape[0]):
+        out[i] = (
+            industry_lut[industries[i]] * 0.40 +
+            history_lut[claims[i]] * 0.35 +
+            profile_lut[profiles[i]] * 0.25
+        )
+
 class UnderwritingScorer:
     """Rule-based underwriting risk scorer"""
     
     def __init__(self):
-        # Industry risk factors (0.0 - 1.0)
-        self.industry_risk_factors = {
+        # Industry risk factors (0.0 - 1.0); names are interned so lookups with
+        # interned input strings match on identity before comparing characters
+        self.industry_risk_factors = {sys.intern(name): factor for name, factor in {
             'Technology': 0.1,
             'Professional Services': 0.15,
             'Education': 0.15,
@@ -18,51 +82,100 @@ class UnderwritingScorer:
             'Manufacturing': 0.50,
             'Transportation': 0.60,
             'Construction': 0.75
+        }.items()}
+        
+        # Integer encoding of the industries for score_batch; unknown
+        # industries map to the last entry, the 0.30 default
+        self._industry_codes = {name: i for i, name in enumerate(self.industry_risk_factors)}
+        self._industry_lut = np.array(
+            list(self.industry_risk_factors.values()) + [0.30], dtype=np.float64
+        )
+        
+        # Every input the UI can send (9 industries x 3 profiles x 0-10 claims),
+        # scored once here so score_applicant is a dict lookup
+        self._results = {
+            (industry, profile, claims): self._score(industry, profile, claims)
+            for industry in self.industry_risk_factors
+            for profile in _PROFILE_FACTORS
+            for claims in range(11)
         }
     
+    def is_supported(self, industry_segment, applicant_risk_profile, prior_claim_count):
+        """Whether the inputs are among the precomputed combinations the UI offers"""
+        return (industry_segment, applicant_risk_profile, prior_claim_count) in self._results
+    
+    def encode_applicants(self, industry_segments, applicant_risk_profiles, prior_claim_counts):
+        """Encode applicant fields into the int8 arrays expected by score_batch"""
+        unknown_industry = len(self._industry_codes)
+        unknown_profile = len(_PROFILE_CODES)
+        industries = np.fromiter(
+            (self._industry_codes.get(s, unknown_industry) for s in industry_segments), dtype=np.int8
+        )
+        profiles = np.fromiter(
+            (_PROFILE_CODES.get(p, unknown_profile) for p in applicant_risk_profiles), dtype=np.int8
+        )
+        # Same banding as calculate_history_factor: round up, then clamp to 0-10
+        claims = np.clip(np.ceil(np.asarray(prior_claim_counts, dtype=np.float64)), 0, 10).astype(np.int8)
+        return industries, profiles, claims
+    
+    def score_batch(self, industries, profiles, claims):
+        """
+        Aggregate scores for a batch of encoded applicants
+        
+        Args:
+            industries, profiles, claims: int8 arrays from encode_applicants
+        
+        Returns:
+            float64 array of aggregate scores (as calculate_aggregate_score)
+        """
+        out = np.empty(industries.shape[0], dtype=np.float64)
+        _score_kernel(industries, profiles, claims,
+                      self._industry_lut, _PROFILE_LUT, _HISTORY_LUT, out)
+        return out
+    
+    def batch_score_df(self, df):
+        """
+        Score every row of a DataFrame with industry_segment,
+        applicant_risk_profile and prior_claim_count columns
+        
+        Returns:
+            a copy of df with aggregate_score and risk_band columns added
+            (replacing any existing columns of those names)
+        """
+        scores = self.score_batch(*self.encode_applicants(
+            df['industry_segment'], df['applicant_risk_profile'], df['prior_claim_count']
+        ))
+        bands = _RISK_BAND_NAMES[np.searchsorted(_RISK_BAND_EDGES, scores, side='right')]
+        return df.assign(aggregate_score=scores, risk_band=bands)
+    
     def calculate_industry_factor(self, industry_segment):
         """Calculate risk factor from industry"""
         return self.industry_risk_factors.get(industry_segment, 0.30)
     
     def calculate_history_factor(self, prior_claim_count):
         """Calculate risk factor from claim history"""
-        if prior_claim_count == 0:
-            return 0.0
-        elif prior_claim_count <= 2:
-            return 0.15
-        elif prior_claim_count <= 4:
-            return 0.35
-        elif prior_claim_count <= 6:
-            return 0.60
-        else:
-            return 0.85
+        # A fractional count falls in the band of the next whole count
+        return _HISTORY_FACTORS[min(max(math.ceil(prior_claim_count), 0), 10)]
     
     def calculate_profile_factor(self, applicant_risk_profile):
         """Calculate risk factor from applicant profile"""
-        profile_factors = {
-            'Low': 0.0,
-            'Medium': 0.30,
-            'High': 0.70
-        }
-        return profile_factors.get(applicant_risk_profile, 0.30)
+        return _PROFILE_FACTORS.get(applicant_risk_profile, 0.30)
     
     def calculate_aggregate_score(self, industry_factor, history_factor, profile_factor):
-        """Aggregate risk factors with weights"""
-        aggregate = (
+        """
+        Aggregate risk factors with weights. With the factor tables above the
+        result is at most 0.75 * 0.40 + 0.85 * 0.35 + 0.70 * 0.25 = 0.7725,
+        so it never needs capping at 1.0
+        """
+        return (
             industry_factor * 0.40 +  # Industry weight: 40%
             history_factor * 0.35 +   # History weight: 35%
             profile_factor * 0.25      # Profile weight: 25%
         )
-        return min(aggregate, 1.0)
     
     def determine_risk_band(self, aggregate_score):
         """Map aggregate score to risk band"""
-        if aggregate_score < 0.30:
-            return 'Low'
-        elif aggregate_score < 0.60:
-            return 'Medium'
-        else:
-            return 'High'
+        return _RISK_BANDS[bisect_right(_RISK_BAND_THRESHOLDS, aggregate_score)]
     
     def score_applicant(self, industry_segment, applicant_risk_profile, prior_claim_count):
         """
@@ -74,51 +187,75 @@ class UnderwritingScorer:
             prior_claim_count: Number of prior claims (0-10)
         
         Returns:
-            dict with risk_band, aggregate_score, factor breakdown, and explanation
+            dict with risk_band, aggregate_score, factor breakdown (also as
+            indented JSON), summary, and explanation; shared between calls,
+            so treat it as read-only
         """
-        # Calculate individual factors
-        industry_factor = self.calculate_industry_factor(industry_segment)
-        history_factor = self.calculate_history_factor(prior_claim_count)
-        profile_factor = self.calculate_profile_factor(applicant_risk_profile)
+        # Only int claim counts hit the table: a float such as 5.0 hashes like 5
+        # but is echoed as "5.0" in the explanation
+        if type(prior_claim_count) is int:
+            result = self._results.get((industry_segment, applicant_risk_profile, prior_claim_count))
+            if result is not None:
+                return result
+        return self._score(industry_segment, applicant_risk_profile, prior_claim_count)
+    
+    def _score(self, industry_segment, applicant_risk_profile, prior_claim_count):
+        """Compute the score_applicant result for one input combination"""
+        # Calculate individual factors (the calculate_*_factor lookups, inlined;
+        # those methods stay as the public single-factor API)
+        industry_factor = self.industry_risk_factors.get(industry_segment, 0.30)
+        history_factor = _HISTORY_FACTORS[min(max(math.ceil(prior_claim_count), 0), 10)]
+        profile_factor = _PROFILE_FACTORS.get(applicant_risk_profile, 0.30)
         
-        # Calculate aggregate score
-        aggregate_score = self.calculate_aggregate_score(
+        # Calculate aggregate score (a builtin float even if a factor arrives
+        # as a numpy scalar, so Gradio serializes it on its plain-float path)
+        aggregate_score = float(self.calculate_aggregate_score(
             industry_factor, history_factor, profile_factor
-        )
+        ))
         
         # Determine risk band
         risk_band = self.determine_risk_band(aggregate_score)
         
-        # Build factor breakdown
+        # Build factor breakdown (each value rounded once, reused below)
         factor_breakdown = {
             'industry_factor': round(industry_factor, 3),
             'history_factor': round(history_factor, 3),
             'profile_factor': round(profile_factor, 3),
             'aggregate_score': round(aggregate_score, 3)
         }
+        rounded_score = factor_breakdown['aggregate_score']
         
         # Build explanation
         explanation = self._build_explanation(
             industry_segment, applicant_risk_profile, prior_claim_count,
-            industry_factor, history_factor, profile_factor, risk_band
+            industry_factor, history_factor, profile_factor, risk_band,
+            aggregate_score
+        )
+        
+        # Factor breakdown as indented JSON, and the quick summary built on it
+        factor_json = json.dumps(factor_breakdown, indent=2)
+        summary = (
+            f"**Risk Band:** {risk_band}\n"
+            f"**Aggregate Score:** {rounded_score:.3f}\n"
+            "**Underwriter Review:** Required\n"
+            "\n"
+            "**Factor Breakdown:**\n"
+            f"{factor_json}"
         )
         
         return {
             'risk_band': risk_band,
-            'aggregate_score': round(aggregate_score, 3),
+            'aggregate_score': rounded_score,
             'factor_breakdown': factor_breakdown,
+            'factor_json': factor_json,
+            'summary': summary,
             'explanation': explanation,
             'underwriter_review_required': True  # Always required
         }
     
     def _build_explanation(self, industry, profile, claims, 
-                          ind_factor, hist_factor, prof_factor, band):
+                          ind_factor, hist_factor, prof_factor, band, aggregate_score):
         """Build human-readable explanation"""
-        explanation = f"### Risk Assessment: {band}\n\n"
-        explanation += f"**Aggregate Risk Score:** {self.calculate_aggregate_score(ind_factor, hist_factor, prof_factor):.3f} / 1.000\n\n"
-        
-        explanation += "**Factor Breakdown:**\n\n"
-        
         # Industry factor
         if ind_factor < 0.30:
             ind_desc = "Low-risk industry sector"
@@ -126,7 +263,6 @@ class UnderwritingScorer:
             ind_desc = "Moderate-risk industry sector"
         else:
             ind_desc = "High-risk industry sector"
-        explanation += f"- **Industry ({industry}):** {ind_factor:.3f} - {ind_desc}\n"
         
         # History factor
         if claims == 0:
@@ -137,25 +273,20 @@ class UnderwritingScorer:
             hist_desc = "Moderate claim frequency (concerning)"
         else:
             hist_desc = f"Excessive claim frequency ({claims} claims)"
-        explanation += f"- **Claim History:** {hist_factor:.3f} - {hist_desc}\n"
-        
-        # Profile factor
-        explanation += f"- **Applicant Profile ({profile}):** {prof_factor:.3f}\n\n"
         
         # Band recommendation
-        explanation += "**Recommendation:**\n\n"
-        if band == 'Low':
-            explanation += "✅ Standard underwriting process may proceed. "
-            explanation += "Minimal additional documentation required.\n"
-        elif band == 'Medium':
-            explanation += "⚠️ Enhanced underwriting review recommended. "
-            explanation += "Request additional documentation and risk mitigation measures.\n"
-        else:
-            explanation += "🚨 High-risk applicant requiring detailed underwriting assessment. "
-            explanation += "Consider risk controls, higher deductibles, or coverage limitations.\n"
+        recommendation = _RECOMMENDATIONS.get(band, _RECOMMENDATIONS['High'])
         
-        explanation += "\n---\n\n"
-        explanation += "⚠️ **MANDATORY: Underwriter review and approval required before binding coverage.**\n"
-        explanation += "This is an advisory tool only. Final underwriting decisions must be made by qualified underwriters."
-        
-        return explanation
+        return (
+            f"### Risk Assessment: {band}\n\n"
+            f"**Aggregate Risk Score:** {aggregate_score:.3f} / 1.000\n\n"
+            "**Factor Breakdown:**\n\n"
+            f"- **Industry ({industry}):** {ind_factor:.3f} - {ind_desc}\n"
+            f"- **Claim History:** {hist_factor:.3f} - {hist_desc}\n"
+            f"- **Applicant Profile ({profile}):** {prof_factor:.3f}\n\n"
+            "**Recommendation:**\n\n"
+            f"{recommendation}\n"
+            "\n---\n\n"
+            "⚠️ **MANDATORY: Underwriter review and approval required before binding coverage.**\n"
+            "This is an advisory tool only. Final underwriting decisions must be made by qualified underwriters."
+        )